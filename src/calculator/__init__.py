@@ -1,5 +1,60 @@
 """
 Calculator package.
+
+Submodules and the names they export are imported on first attribute access,
+so ``import calculator`` stays cheap for short-lived processes.
 """
 
 __version__ = "1.0.0"
+
+_SUBMODULES = (
+    "batch",
+    "calculator",
+    "coercion",
+    "differential",
+    "lookup",
+    "planner",
+    "rolling",
+)
+
+_LAZY_ATTRIBUTES = {
+    "Calculator": "calculator",
+    "InvalidInputException": "calculator",
+    "Operation": "calculator",
+    "resolve_opcode": "calculator",
+    "BatchResult": "batch",
+    "run_batch": "batch",
+    "STATUS_OK": "batch",
+    "STATUS_OUT_OF_RANGE": "batch",
+    "STATUS_DIVIDE_BY_ZERO": "batch",
+    "STATUS_PARSE_ERROR": "batch",
+    "coerce_column": "coercion",
+    "calculate_column": "coercion",
+    "parse_number": "coercion",
+    "ExecutionPlanner": "planner",
+    "TabledCalculator": "lookup",
+    "RollingSum": "rolling",
+    "RollingMean": "rolling",
+    "RollingMin": "rolling",
+    "RollingMax": "rolling",
+}
+
+__all__ = sorted(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    import importlib
+
+    if name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(f".{_LAZY_ATTRIBUTES[name]}", __name__)
+        value = getattr(module, name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES) | set(_SUBMODULES))
@@ -0,0 +1,200 @@
+"""
+Compact structure-of-arrays container for batched calculator results.
+"""
+
+from array import array
+
+from .calculator import Calculator, InvalidInputException
+
+STATUS_OK = 0
+STATUS_OUT_OF_RANGE = 1
+STATUS_DIVIDE_BY_ZERO = 2
+STATUS_PARSE_ERROR = 3
+
+DIVIDE_BY_ZERO_MESSAGE = "Cannot divide by zero"
+
+
+class BatchResult:
+    """Results of a batched workload stored column-wise.
+
+    Values live in an ``array('d')`` column and outcomes in an ``array('b')``
+    status column, so a batch costs nine bytes per element instead of a
+    Python object per element. Failed rows keep a value of ``0.0``; the
+    offending operand is stored sparsely and the exception message is only
+    built when it is requested.
+
+    Both columns support the buffer protocol, so ``memoryview(result.values)``
+    or ``numpy.frombuffer(result.values)`` share memory without copying.
+    """
+
+    __slots__ = ("values", "statuses", "_operands", "min_value", "max_value")
+
+    def __init__(self, min_value=Calculator.MIN_VALUE, max_value=Calculator.MAX_VALUE):
+        self.values = array("d")
+        self.statuses = array("b")
+        self._operands = {}
+        self.min_value = min_value
+        self.max_value = max_value
+
+    @classmethod
+    def for_calculator(cls, calculator, length=0):
+        """Create a result that reports the calculator's range.
+
+        Args:
+            calculator: Calculator whose range is used in error messages
+            length: Number of rows to preallocate as ok with value ``0.0``
+        """
+        result = cls(calculator.MIN_VALUE, calculator.MAX_VALUE)
+        if length:
+            result.values = array("d", bytes(length * result.values.itemsize))
+            result.statuses = array("b", bytes(length))
+        return result
+
+    def __len__(self):
+        return len(self.statuses)
+
+    def __getitem__(self, index):
+        """Return the value at index, raising the row's error if it failed."""
+        if self.statuses[index] != STATUS_OK:
+            raise self.error(index)
+        return self.values[index]
+
+    def append_value(self, value):
+        """Record a successful result."""
+        self.values.append(value)
+        self.statuses.append(STATUS_OK)
+
+    def append_error(self, status, operand=None):
+        """Record a failed row.
+
+        Args:
+            status: One of the ``STATUS_*`` error codes
+            operand: Input that caused the failure, used for the message
+        """
+        if status == STATUS_OK:
+            raise ValueError("append_error requires an error status")
+        if operand is not None:
+            self._operands[len(self.statuses)] = operand
+        self.values.append(0.0)
+        self.statuses.append(status)
+
+    def set_error(self, index, status, operand=None):
+        """Mark a preallocated row as failed.
+
+        Args:
+            index: Row to update
+            status: One of the ``STATUS_*`` error codes
+            operand: Input that caused the failure, used for the message
+        """
+        if status == STATUS_OK:
+            raise ValueError("set_error requires an error status")
+        if operand is not None:
+            self._operands[index] = operand
+        self.values[index] = 0.0
+        self.statuses[index] = status
+
+    def extend(self, other):
+        """Append all rows of another BatchResult."""
+        offset = len(self.statuses)
+        self.values.extend(other.values)
+        self.statuses.extend(other.statuses)
+        for index, operand in other._operands.items():
+            self._operands[offset + index] = operand
+
+    def is_ok(self, index):
+        """Return True if the row at index succeeded."""
+        return self.statuses[index] == STATUS_OK
+
+    @property
+    def error_count(self):
+        """Number of failed rows."""
+        return len(self.statuses) - self.statuses.count(STATUS_OK)
+
+    def error_indices(self):
+        """Return the indices of failed rows in ascending order."""
+        return [i for i, status in enumerate(self.statuses) if status != STATUS_OK]
+
+    def message(self, index):
+        """Build the error message for a failed row, or None if it succeeded."""
+        status = self.statuses[index]
+        if status == STATUS_OK:
+            return None
+        if status == STATUS_DIVIDE_BY_ZERO:
+            return DIVIDE_BY_ZERO_MESSAGE
+        operand = self._operands.get(index)
+        if status == STATUS_PARSE_ERROR:
+            return f"Cannot parse {operand!r} as a number"
+        return f"Input {operand} is outside valid range [{self.min_value}, {self.max_value}]"
+
+    def error(self, index):
+        """Materialize the exception for a failed row, or None if it succeeded.
+
+        The exception type and message match what the scalar ``Calculator``
+        methods raise for the same inputs.
+        """
+        status = self.statuses[index]
+        if status == STATUS_OK:
+            return None
+        if status == STATUS_DIVIDE_BY_ZERO:
+            return ValueError(self.message(index))
+        return InvalidInputException(self.message(index))
+
+    def to_list(self):
+        """Expand into a list of floats and exception instances."""
+        values = self.values
+        return [
+            values[i] if status == STATUS_OK else self.error(i)
+            for i, status in enumerate(self.statuses)
+        ]
+
+    def tofile(self, values_file, statuses_file=None):
+        """Write the raw columns to binary files without copying."""
+        self.values.tofile(values_file)
+        if statuses_file is not None:
+            self.statuses.tofile(statuses_file)
+
+    @property
+    def nbytes(self):
+        """Approximate memory used by the columns and sparse operands."""
+        return (
+            len(self.values) * self.values.itemsize
+            + len(self.statuses) * self.statuses.itemsize
+            + len(self._operands) * 2 * 8
+        )
+
+
+def out_of_range_operand(calculator, a, b):
+    """Return the operand of a failed pair that is outside the range.
+
+    Batch engines use it to record the value named in the
+    InvalidInputException message; a is reported when both are outside.
+    """
+    if a < calculator.MIN_VALUE or a > calculator.MAX_VALUE:
+        return a
+    return b
+
+
+def run_batch(calculator, operation, a_values, b_values):
+    """Apply a calculator operation pairwise and collect a BatchResult.
+
+    Args:
+        calculator: Calculator instance providing the operation
+        operation: Name of the method, e.g. ``"add"`` or ``"divide"``
+        a_values: Iterable of first operands
+        b_values: Iterable of second operands
+
+    Returns:
+        BatchResult with one row per operand pair
+    """
+    method = getattr(calculator, operation)
+    result = BatchResult.for_calculator(calculator)
+    append_value = result.append_value
+    append_error = result.append_error
+    for a, b in zip(a_values, b_values):
+        try:
+            append_value(method(a, b))
+        except InvalidInputException:
+            append_error(STATUS_OUT_OF_RANGE, out_of_range_operand(calculator, a, b))
+        except ValueError:
+            append_error(STATUS_DIVIDE_BY_ZERO)
+    return result
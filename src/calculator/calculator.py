@@ -2,6 +2,10 @@
 A simple calculator module with basic arithmetic operations.
 """
 
+from enum import IntEnum
+from itertools import compress, repeat
+from operator import eq
+
 
 class InvalidInputException(Exception):
     """Exception raised when input values are outside the valid range."""
@@ -9,6 +13,45 @@ class InvalidInputException(Exception):
     pass
 
 
+class Operation(IntEnum):
+    """Opcodes for the calculator's binary operations."""
+
+    ADD = 0
+    SUBTRACT = 1
+    MULTIPLY = 2
+    DIVIDE = 3
+
+
+# Method names indexed by opcode.
+OPERATION_NAMES = ("add", "subtract", "multiply", "divide")
+
+# Every accepted spelling of an operation mapped to its opcode. Operation
+# members hash like their integer values, so they resolve through the ints.
+_OPCODES = {
+    **{name: opcode for opcode, name in enumerate(OPERATION_NAMES)},
+    **{symbol: opcode for opcode, symbol in enumerate("+-*/")},
+    **{opcode: opcode for opcode in range(len(OPERATION_NAMES))},
+}
+
+
+def resolve_opcode(op):
+    """Return the opcode for an operation name, symbol, Operation or int.
+
+    Raises:
+        ValueError: If op does not name a calculator operation
+    """
+    if isinstance(op, bool) or not isinstance(op, (str, int)):
+        raise ValueError(f"Unknown operation: {op!r}")
+    try:
+        return _OPCODES[op]
+    except (KeyError, TypeError):
+        raise ValueError(f"Unknown operation: {op!r}") from None
+
+
+# Operation functions indexed by opcode, built once per Calculator class.
+_DISPATCH_TABLES = {}
+
+
 class Calculator:
     """Calculator class providing basic arithmetic operations."""
 
@@ -26,6 +69,17 @@ class Calculator:
                 f"Input {b} is outside valid range [{self.MIN_VALUE}, {self.MAX_VALUE}]"
             )
 
+    def validate_input(self, value):
+        """Validate that a single input is within the allowed range.
+
+        Raises:
+            InvalidInputException: If value is outside valid range
+        """
+        if value < self.MIN_VALUE or value > self.MAX_VALUE:
+            raise InvalidInputException(
+                f"Input {value} is outside valid range [{self.MIN_VALUE}, {self.MAX_VALUE}]"
+            )
+
     def add(self, a, b):
         """Add two numbers.
 
@@ -92,3 +146,104 @@ class Calculator:
         if b == 0:
             raise ValueError("Cannot divide by zero")
         return a / b
+
+    def _operations(self):
+        """Return the operation functions of this class indexed by opcode."""
+        cls = type(self)
+        dispatch = _DISPATCH_TABLES.get(cls)
+        if dispatch is None:
+            dispatch = _DISPATCH_TABLES[cls] = tuple(
+                getattr(cls, name) for name in OPERATION_NAMES
+            )
+        return dispatch
+
+    def apply(self, op, a, b):
+        """Apply an operation given by name, symbol, Operation or opcode.
+
+        Args:
+            op: e.g. ``"add"``, ``"+"``, ``Operation.ADD`` or ``0``
+            a: First number
+            b: Second number
+
+        Returns:
+            Result of the operation
+
+        Raises:
+            ValueError: If op is unknown, or b is zero for a division
+            InvalidInputException: If any input is outside valid range
+        """
+        return self._operations()[resolve_opcode(op)](self, a, b)
+
+    def apply_many(self, ops, a_values, b_values):
+        """Apply one operation, or one operation per record, to operand pairs.
+
+        Mixed batches are grouped by opcode and each group runs in its own
+        loop, so the operation is resolved once per group, not per record.
+
+        Args:
+            ops: A single operation, or a sequence with one per operand pair
+            a_values: Sequence of first operands
+            b_values: Sequence of second operands
+
+        Returns:
+            BatchResult with one row per operand pair, failures encoded
+
+        Raises:
+            ValueError: If an operation is unknown or the lengths differ
+        """
+        from .batch import (
+            STATUS_DIVIDE_BY_ZERO,
+            STATUS_OUT_OF_RANGE,
+            BatchResult,
+            out_of_range_operand,
+            run_batch,
+        )
+
+        a_values = list(a_values)
+        b_values = list(b_values)
+        if isinstance(ops, str) or not hasattr(ops, "__iter__"):
+            opcode = resolve_opcode(ops)
+            if len(a_values) != len(b_values):
+                raise ValueError("a_values and b_values must have the same length")
+            return run_batch(self, OPERATION_NAMES[opcode], a_values, b_values)
+
+        ops = list(ops)
+        if not len(ops) == len(a_values) == len(b_values):
+            raise ValueError("ops, a_values and b_values must have the same length")
+        try:
+            # Keyed by type as well, so 1.0 or True is not folded into 1.
+            typed = set(zip(map(type, ops), ops))
+        except TypeError:
+            # An unhashable entry cannot name an operation.
+            raise ValueError(
+                "Unknown operation: ops must be names, symbols or opcodes"
+            ) from None
+        for _, op in typed:
+            resolve_opcode(op)
+        # Every entry is now a valid str or int, so equal values name the
+        # same operation and can be grouped together.
+        groups = tuple([] for _ in OPERATION_NAMES)
+        positions = range(len(ops))
+        for op in {op for _, op in typed}:
+            matches = compress(positions, map(eq, ops, repeat(op)))
+            groups[resolve_opcode(op)].extend(matches)
+
+        result = BatchResult.for_calculator(self, len(ops))
+        values = result.values
+        set_error = result.set_error
+        operations = self._operations()
+        a_item = a_values.__getitem__
+        b_item = b_values.__getitem__
+        for function, indices in zip(operations, groups):
+            method = function.__get__(self)
+            rows = zip(indices, map(a_item, indices), map(b_item, indices))
+            for index, a, b in rows:
+                try:
+                    values[index] = method(a, b)
+                except InvalidInputException:
+                    set_error(
+                        index, STATUS_OUT_OF_RANGE, out_of_range_operand(self, a, b)
+                    )
+                except ValueError:
+                    set_error(index, STATUS_DIVIDE_BY_ZERO)
+        return result
@@ -0,0 +1,234 @@
+"""
+Bulk parsing and coercion of operand columns for the calculator.
+"""
+
+from collections import namedtuple
+from decimal import Decimal
+
+from .batch import (
+    STATUS_DIVIDE_BY_ZERO,
+    STATUS_OUT_OF_RANGE,
+    STATUS_PARSE_ERROR,
+    BatchResult,
+    out_of_range_operand,
+)
+from .calculator import InvalidInputException
+
+CoercedColumn = namedtuple("CoercedColumn", ["values", "errors"])
+CoercedColumn.__doc__ = """Numbers parsed from a column.
+
+values holds one number per row, or None where the row could not be
+coerced; errors maps those row indices to the raw input.
+"""
+
+_NUMERIC_TYPES = frozenset((int, float))
+
+# Most distinct literals a parse cache keeps; later new literals are parsed
+# but not stored, so columns of unique values cannot grow it without bound.
+CACHE_LIMIT = 65536
+
+# Leading rows inspected to decide whether a text column repeats literals.
+_SAMPLE_SIZE = 256
+
+
+def parse_number(text):
+    """Parse numeric text, keeping integers as int.
+
+    Args:
+        text: String such as ``"42"``, ``" -3.5 "`` or ``"1e3"``
+
+    Returns:
+        int if the text is an integer literal, float otherwise
+
+    Raises:
+        ValueError: If the text is not a number, is NaN or uses underscores
+    """
+    if text.isdecimal():
+        return int(text)
+    if "_" in text:
+        raise ValueError(f"could not convert string to number: {text!r}")
+    value = float(text)
+    if value != value:
+        raise ValueError(f"NaN is not a valid operand: {text!r}")
+    # Signed or padded integer literals, e.g. " -42 ", are kept exact.
+    if text.strip().lstrip("+-").isdecimal():
+        return int(text)
+    return value
+
+
+def _parse_or_none(text):
+    try:
+        return parse_number(text)
+    except ValueError:
+        return None
+
+
+def _coerce_decimal(value):
+    if value.is_nan():
+        raise ValueError(f"NaN is not a valid operand: {value!r}")
+    if value.is_infinite():
+        # Infinities become float infinities and fail the range check later.
+        return float(value)
+    integral = value.to_integral_value()
+    if value == integral:
+        return int(integral)
+    return float(value)
+
+
+_CONVERTERS = {
+    int: int,
+    float: float,
+    Decimal: _coerce_decimal,
+}
+
+
+def _keep(value):
+    return value
+
+
+def _subclass_converter(item):
+    # bool and other int/float subclasses are accepted by Calculator as-is.
+    if isinstance(item, (int, float)):
+        return _keep
+    if isinstance(item, Decimal):
+        return _coerce_decimal
+    if isinstance(item, str):
+        return parse_number
+    return None
+
+
+def _parse_texts(column, cache):
+    sample = column[:_SAMPLE_SIZE]
+    if len(set(sample)) > len(sample) // 2:
+        # Mostly distinct literals: caching would only cost time and memory.
+        values = list(map(_parse_or_none, column))
+        errors = {}
+        if None in values:
+            errors = {
+                row: text
+                for row, (text, value) in enumerate(zip(column, values))
+                if value is None
+            }
+        return values, errors
+    values = []
+    errors = {}
+    append = values.append
+    lookup = cache.get
+    for row, text in enumerate(column):
+        value = lookup(text)
+        if value is None:
+            try:
+                value = parse_number(text)
+            except ValueError:
+                errors[row] = text
+                append(None)
+                continue
+            if len(cache) < CACHE_LIMIT:
+                cache[text] = value
+        append(value)
+    return values, errors
+
+
+def _coerce_mixed(column, cache):
+    values = []
+    errors = {}
+    append = values.append
+    for row, item in enumerate(column):
+        kind = type(item)
+        if kind is str:
+            value = cache.get(item)
+            if value is None:
+                try:
+                    value = parse_number(item)
+                except ValueError:
+                    errors[row] = item
+                    append(None)
+                    continue
+                if len(cache) < CACHE_LIMIT:
+                    cache[item] = value
+            append(value)
+            continue
+        converter = _CONVERTERS.get(kind) or _subclass_converter(item)
+        if converter is None:
+            errors[row] = item
+            append(None)
+            continue
+        try:
+            append(converter(item))
+        except (ValueError, ArithmeticError):
+            errors[row] = item
+            append(None)
+    return values, errors
+
+
+def coerce_column(column, cache=None):
+    """Coerce a column of strings, ints, floats and Decimals to numbers.
+
+    The column's element types are inspected once. Columns that are already
+    int/float are returned unchanged, all-string columns go through a
+    dedicated parsing loop, and only genuinely mixed columns dispatch per
+    value. Repeated literals are parsed once and share the cached number;
+    text columns whose leading rows are mostly distinct skip the cache, and
+    the cache stops growing at CACHE_LIMIT entries. NaN and underscore
+    literals are reported as errors, like any other unparseable text.
+
+    Args:
+        column: Sequence of operands
+        cache: Optional dict of text to number, shared across columns
+
+    Returns:
+        CoercedColumn of values and per-row parse errors
+    """
+    if cache is None:
+        cache = {}
+    column = list(column)
+    kinds = set(map(type, column))
+    if kinds <= _NUMERIC_TYPES:
+        return CoercedColumn(column, {})
+    if kinds == {str}:
+        return CoercedColumn(*_parse_texts(column, cache))
+    return CoercedColumn(*_coerce_mixed(column, cache))
+
+
+def calculate_column(calculator, operation, a_column, b_column, cache=None):
+    """Coerce two operand columns and apply a calculator operation row by row.
+
+    Args:
+        calculator: Calculator instance providing the operation
+        operation: Name of the method, e.g. ``"add"`` or ``"divide"``
+        a_column: Column of first operands
+        b_column: Column of second operands
+        cache: Optional dict of text to number, shared across columns
+
+    Returns:
+        BatchResult where unparseable rows carry ``STATUS_PARSE_ERROR``
+
+    Raises:
+        ValueError: If the columns have different lengths
+    """
+    a_column = list(a_column)
+    b_column = list(b_column)
+    if len(a_column) != len(b_column):
+        raise ValueError("a_column and b_column must have the same length")
+    if cache is None:
+        cache = {}
+    a_values, a_errors = coerce_column(a_column, cache)
+    b_values, b_errors = coerce_column(b_column, cache)
+    method = getattr(calculator, operation)
+    result = BatchResult.for_calculator(calculator)
+    append_value = result.append_value
+    append_error = result.append_error
+    for row, (a, b) in enumerate(zip(a_values, b_values)):
+        if a is None:
+            append_error(STATUS_PARSE_ERROR, a_errors[row])
+            continue
+        if b is None:
+            append_error(STATUS_PARSE_ERROR, b_errors[row])
+            continue
+        try:
+            append_value(method(a, b))
+        except InvalidInputException:
+            append_error(STATUS_OUT_OF_RANGE, out_of_range_operand(calculator, a, b))
+        except ValueError:
+            append_error(STATUS_DIVIDE_BY_ZERO)
+    return result
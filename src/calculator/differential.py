@@ -0,0 +1,310 @@
+"""
+Differential testing harness for alternative calculator execution engines.
+
+Every registered engine is run against the scalar ``Calculator`` methods on
+the same random and edge-case operands. Results, exception types and
+exception messages must match exactly; each engine is timed in the same run.
+"""
+
+import math
+import random
+import time
+from collections import namedtuple
+from contextlib import ExitStack
+from importlib.util import find_spec
+
+from .calculator import Calculator
+from .lookup import DEFAULT_TABLE_HIGH, TabledCalculator
+
+OPERATIONS = ("add", "subtract", "multiply", "divide")
+
+# Spacing between adjacent floats at the magnitude of the range limits.
+_LIMIT_ULP = 2.0**-33
+
+Mismatch = namedtuple("Mismatch", ["index", "a", "b", "expected", "actual"])
+EngineRun = namedtuple(
+    "EngineRun", ["engine", "operation", "seconds", "reference_seconds", "mismatches"]
+)
+
+ENGINES = {}
+
+
+def register_engine(name, returns_floats=False, setup=None):
+    """Register an execution engine under name.
+
+    An engine is called as ``engine(calculator, operation, a_values,
+    b_values)`` and returns one value or exception instance per operand pair.
+    Engines backed by a BatchResult set returns_floats, so integer reference
+    results are compared as floats; every other engine must match the
+    reference result type exactly.
+
+    Engines with costly state pass setup. run_differential calls
+    ``setup(calculator, stack)`` once, outside the timed region, and times
+    the engine it returns instead; cleanup registered on the ExitStack
+    stack runs when the differential run ends.
+    """
+
+    def decorator(engine):
+        engine.returns_floats = returns_floats
+        engine.setup = setup
+        ENGINES[name] = engine
+        return engine
+
+    return decorator
+
+
+def edge_values(calculator=None):
+    """Return operands at and around the calculator's range limits."""
+    calculator = calculator or Calculator()
+    low = calculator.MIN_VALUE
+    high = calculator.MAX_VALUE
+    return [
+        0,
+        -0.0,
+        1,
+        -1,
+        0.5,
+        -0.5,
+        1e-300,
+        high,
+        low,
+        high + 1,
+        low - 1,
+        high - 1,
+        low + 1,
+        float(high),
+        float(low),
+        high + _LIMIT_ULP,
+        high - _LIMIT_ULP,
+        low + _LIMIT_ULP,
+        low - _LIMIT_ULP,
+        float("inf"),
+        float("-inf"),
+    ]
+
+
+def generate_operands(count, seed=0, calculator=None):
+    """Generate operand pairs mixing edge cases with random values.
+
+    Args:
+        count: Number of operand pairs
+        seed: Seed for the random generator
+        calculator: Calculator whose range limits are targeted
+
+    Returns:
+        Tuple of (a_values, b_values) lists
+    """
+    calculator = calculator or Calculator()
+    rng = random.Random(seed)
+    edges = edge_values(calculator)
+    span = max(abs(calculator.MIN_VALUE), abs(calculator.MAX_VALUE))
+    limit = int(span * 1.1)
+
+    def operand():
+        roll = rng.random()
+        if roll < 0.2:
+            return rng.choice(edges)
+        if roll < 0.3:
+            return 0
+        if roll < 0.65:
+            return rng.randint(-limit, limit)
+        if roll < 0.8:
+            return rng.randint(-1000, 1000)
+        return rng.uniform(-limit, limit)
+
+    a_values = [operand() for _ in range(count)]
+    b_values = [operand() for _ in range(count)]
+    return a_values, b_values
+
+
+def reference_outcomes(calculator, operation, a_values, b_values):
+    """Run the scalar Calculator method on every operand pair."""
+    method = getattr(calculator, operation)
+    outcomes = []
+    for a, b in zip(a_values, b_values):
+        try:
+            outcomes.append(method(a, b))
+        except Exception as exc:
+            outcomes.append(exc)
+    return outcomes
+
+
+def _same_outcome(expected, actual, returns_floats=False):
+    if isinstance(expected, Exception) or isinstance(actual, Exception):
+        return type(expected) is type(actual) and str(expected) == str(actual)
+    if returns_floats and isinstance(expected, int):
+        expected = float(expected)
+    if type(expected) is not type(actual):
+        return False
+    if expected != expected:
+        return actual != actual
+    if expected == 0 and isinstance(expected, float):
+        return math.copysign(1.0, expected) == math.copysign(1.0, actual)
+    return expected == actual
+
+
+def compare_outcomes(a_values, b_values, expected, actual, returns_floats=False):
+    """Return the Mismatch entries between two outcome lists.
+
+    Values must have the same type and, for zeros, the same sign. With
+    returns_floats, integer expected values are compared as floats.
+    """
+    mismatches = []
+    if len(expected) != len(actual):
+        mismatches.append(Mismatch(None, None, None, len(expected), len(actual)))
+    for index, (want, got) in enumerate(zip(expected, actual)):
+        if not _same_outcome(want, got, returns_floats):
+            mismatches.append(
+                Mismatch(index, a_values[index], b_values[index], want, got)
+            )
+    return mismatches
+
+
+def run_differential(
+    calculator=None, engines=None, operations=OPERATIONS, count=10000, seed=0
+):
+    """Check engines against the reference Calculator and time them.
+
+    Args:
+        calculator: Reference Calculator instance
+        engines: Mapping of name to engine, defaults to all registered engines
+        operations: Operation names to exercise
+        count: Number of operand pairs per operation
+        seed: Seed for operand generation
+
+    Returns:
+        List of EngineRun entries, one per engine and operation
+    """
+    calculator = calculator or Calculator()
+    engines = ENGINES if engines is None else engines
+    a_values, b_values = generate_operands(count, seed, calculator)
+    runs = []
+    with ExitStack() as stack:
+        prepared = {}
+        for name, engine in engines.items():
+            setup = getattr(engine, "setup", None)
+            prepared[name] = engine if setup is None else setup(calculator, stack)
+        for operation in operations:
+            start = time.perf_counter()
+            expected = reference_outcomes(calculator, operation, a_values, b_values)
+            reference_seconds = time.perf_counter() - start
+            for name, engine in engines.items():
+                start = time.perf_counter()
+                actual = prepared[name](calculator, operation, a_values, b_values)
+                seconds = time.perf_counter() - start
+                mismatches = compare_outcomes(
+                    a_values,
+                    b_values,
+                    expected,
+                    list(actual),
+                    getattr(engine, "returns_floats", False),
+                )
+                runs.append(
+                    EngineRun(name, operation, seconds, reference_seconds, mismatches)
+                )
+    return runs
+
+
+def format_runs(runs):
+    """Format EngineRun entries as a plain-text table."""
+    lines = [
+        f"{'engine':<16}{'operation':<10}{'seconds':>10}{'speedup':>9}{'mismatches':>12}"
+    ]
+    for run in runs:
+        speedup = run.reference_seconds / run.seconds if run.seconds else float("inf")
+        lines.append(
+            f"{run.engine:<16}{run.operation:<10}{run.seconds:>10.4f}"
+            f"{speedup:>8.2f}x{len(run.mismatches):>12}"
+        )
+    return "\n".join(lines)
+
+
+@register_engine("batch", returns_floats=True)
+def _batch_engine(calculator, operation, a_values, b_values):
+    from .batch import run_batch
+
+    return run_batch(calculator, operation, a_values, b_values).to_list()
+
+
+@register_engine("coercion", returns_floats=True)
+def _coercion_engine(calculator, operation, a_values, b_values):
+    from .coercion import calculate_column
+
+    a_texts = [repr(a) for a in a_values]
+    b_texts = [repr(b) for b in b_values]
+    return calculate_column(calculator, operation, a_texts, b_texts).to_list()
+
+
+@register_engine("apply")
+def _apply_engine(calculator, operation, a_values, b_values):
+    apply = calculator.apply
+    outcomes = []
+    for a, b in zip(a_values, b_values):
+        try:
+            outcomes.append(apply(operation, a, b))
+        except Exception as exc:
+            outcomes.append(exc)
+    return outcomes
+
+
+@register_engine("apply_many", returns_floats=True)
+def _apply_many_engine(calculator, operation, a_values, b_values):
+    ops = [operation] * len(a_values)
+    return calculator.apply_many(ops, a_values, b_values).to_list()
+
+
+def _tabled_copy(calculator):
+    high = min(DEFAULT_TABLE_HIGH, int(math.floor(calculator.MAX_VALUE)))
+    return TabledCalculator.from_calculator(calculator, high)
+
+
+def _setup_lookup(calculator, stack):
+    tabled = _tabled_copy(calculator)
+
+    def engine(calculator, operation, a_values, b_values):
+        return reference_outcomes(tabled, operation, a_values, b_values)
+
+    return engine
+
+
+@register_engine("lookup", setup=_setup_lookup)
+def _lookup_engine(calculator, operation, a_values, b_values):
+    tabled = _tabled_copy(calculator)
+    return reference_outcomes(tabled, operation, a_values, b_values)
+
+
+def _planner_setup(backend):
+    def setup(calculator, stack):
+        from .planner import ExecutionPlanner
+
+        planner = stack.enter_context(ExecutionPlanner(max_workers=2))
+
+        def engine(calculator, operation, a_values, b_values):
+            result = planner.execute(
+                calculator, operation, a_values, b_values, backend=backend
+            )
+            return result.to_list()
+
+        return engine
+
+    return setup
+
+
+def _planner_engine(backend):
+    setup = _planner_setup(backend)
+
+    def engine(calculator, operation, a_values, b_values):
+        with ExitStack() as stack:
+            run = setup(calculator, stack)
+            return run(calculator, operation, a_values, b_values)
+
+    return register_engine(backend, returns_floats=True, setup=setup)(engine)
+
+
+_planner_engine("parallel")
+if find_spec("numpy") is not None:
+    _planner_engine("vectorized")
+
+
+if __name__ == "__main__":
+    print(format_runs(run_differential()))
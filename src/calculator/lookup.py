@@ -0,0 +1,195 @@
+"""
+Precomputed result tables for integer operations over a small domain.
+"""
+
+import sys
+
+from .calculator import Calculator
+
+# Default cap on the memory used by all tables of one calculator. Beyond
+# about 1 MiB the tables fall out of cache and lose to plain arithmetic.
+DEFAULT_MEMORY_BUDGET = 1024 * 1024
+
+# Default largest tabulated operand; both tables together take 0.7 MiB.
+DEFAULT_TABLE_HIGH = 100
+
+TABLE_OPERATIONS = ("multiply", "divide")
+
+
+def estimate_nbytes(high, operations=TABLE_OPERATIONS):
+    """Return the approximate bytes the tables for [0, high] would occupy.
+
+    Counts the row lists and one result object per entry; small integers
+    are shared by CPython, so this is an upper bound for products.
+    """
+    width = high + 1
+    rows = sys.getsizeof([]) * (width + 1) + 8 * width * (width + 1)
+    nbytes = 0
+    if "multiply" in operations:
+        nbytes += rows + width * width * sys.getsizeof(high * high)
+    if "divide" in operations:
+        nbytes += rows + width * width * sys.getsizeof(0.5)
+    return nbytes
+
+
+class TabledCalculator(Calculator):
+    """Calculator answering small integer multiply/divide from tables.
+
+    Results for every int pair in [0, high] are precomputed into row lists,
+    so multiply and divide return ``rows[a][b]`` for them. Other operands,
+    zero divisors and operations without a table take the Calculator path,
+    so results, result types and exceptions are unchanged.
+
+    The domain is checked against MIN_VALUE/MAX_VALUE when the tables are
+    built; build a new calculator after changing the range.
+    """
+
+    def __init__(
+        self,
+        high=DEFAULT_TABLE_HIGH,
+        operations=TABLE_OPERATIONS,
+        memory_budget=DEFAULT_MEMORY_BUDGET,
+    ):
+        """Build the tables.
+
+        Args:
+            high: Largest integer operand in the domain [0, high]
+            operations: Operations to tabulate, "multiply" and/or "divide"
+            memory_budget: Maximum bytes allowed for all tables
+
+        Raises:
+            InvalidInputException: If the domain is outside valid range
+            ValueError: If high is not a non-negative int, an operation is
+                not supported or the tables would exceed memory_budget
+        """
+        self._build_tables(high, operations, memory_budget)
+
+    @classmethod
+    def from_calculator(
+        cls,
+        calculator,
+        high=DEFAULT_TABLE_HIGH,
+        operations=TABLE_OPERATIONS,
+        memory_budget=DEFAULT_MEMORY_BUDGET,
+    ):
+        """Build a tabled calculator with calculator's instance settings.
+
+        Instance attributes such as a per-instance MAX_VALUE are copied
+        before the domain is checked; methods come from TabledCalculator.
+        """
+        tabled = cls.__new__(cls)
+        tabled.__dict__.update(vars(calculator))
+        tabled._build_tables(high, operations, memory_budget)
+        return tabled
+
+    def _build_tables(self, high, operations, memory_budget):
+        if isinstance(high, bool) or not isinstance(high, int) or high < 0:
+            raise ValueError("Lookup domain must be a non-negative int")
+        unsupported = set(operations) - set(TABLE_OPERATIONS)
+        if unsupported:
+            raise ValueError(
+                f"Lookup tables do not support: {', '.join(sorted(unsupported))}"
+            )
+        self._validate_inputs(0, high)
+        required = estimate_nbytes(high, operations)
+        if required > memory_budget:
+            raise ValueError(
+                f"Lookup tables need {required} bytes, over the budget of "
+                f"{memory_budget} bytes"
+            )
+        self.high = high
+        self.operations = tuple(operations)
+        domain = range(high + 1)
+        # An empty table makes every lookup miss, so the methods need no
+        # separate check for an operation that was not tabulated.
+        self._products = ()
+        self._quotients = ()
+        if "multiply" in operations:
+            self._products = [[a * b for b in domain] for a in domain]
+        if "divide" in operations:
+            # Column 0 is never read: zero divisors take the normal path.
+            self._quotients = [[a / b if b else 0.0 for b in domain] for a in domain]
+
+    def multiply(self, a, b):
+        """Multiply two numbers, from the table for ints in the domain.
+
+        Raises:
+            InvalidInputException: If any input is outside valid range
+        """
+        if type(a) is int is type(b) and a >= 0 and b >= 0:  # noqa: E721
+            try:
+                return self._products[a][b]
+            except IndexError:
+                pass
+        return super().multiply(a, b)
+
+    def divide(self, a, b):
+        """Divide a by b, from the table for ints in the domain.
+
+        Raises:
+            InvalidInputException: If any input is outside valid range
+            ValueError: If b is zero
+        """
+        if type(a) is int is type(b) and a >= 0 and b > 0:  # noqa: E721
+            try:
+                return self._quotients[a][b]
+            except IndexError:
+                pass
+        return super().divide(a, b)
+
+    def lookup_table_footprint(self):
+        """Return the approximate bytes used by each table and in total."""
+        report = {
+            operation: estimate_nbytes(self.high, (operation,))
+            for operation in self.operations
+        }
+        report["total"] = sum(report.values())
+        return report
+
+
+def benchmark(high=DEFAULT_TABLE_HIGH, repeat=5, number=200000):
+    """Time table lookups against the plain path.
+
+    Args:
+        high: Largest integer operand in the domain [0, high]
+        repeat: Timing repetitions, the best one is reported
+        number: Operations per repetition
+
+    Returns:
+        Dict with per-operation timings in seconds and the table footprint
+    """
+    import random
+    import timeit
+
+    plain = Calculator()
+    tabled = TabledCalculator(high)
+    rng = random.Random(0)
+    pairs = [
+        (rng.randint(0, high), rng.randint(1, max(high, 1))) for _ in range(number)
+    ]
+    report = {"footprint": tabled.lookup_table_footprint()}
+    for operation in TABLE_OPERATIONS:
+        timings = {}
+        for label, calculator in (("plain", plain), ("table", tabled)):
+            method = getattr(calculator, operation)
+            timings[label] = min(
+                timeit.repeat(
+                    lambda: [method(a, b) for a, b in pairs], repeat=repeat, number=1
+                )
+            )
+        report[operation] = timings
+    return report
+
+
+if __name__ == "__main__":
+    high = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_TABLE_HIGH
+    results = benchmark(high)
+    for operation in TABLE_OPERATIONS:
+        timings = results[operation]
+        print(
+            f"{operation:<10} plain {timings['plain']:.4f}s  "
+            f"table {timings['table']:.4f}s  "
+            f"speedup {timings['plain'] / timings['table']:.2f}x"
+        )
+    for name, nbytes in results["footprint"].items():
+        print(f"{name:<10} {nbytes / 1024 / 1024:.2f} MiB")
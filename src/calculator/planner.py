@@ -0,0 +1,479 @@
+"""
+Adaptive execution planner choosing scalar, vectorized or parallel backends.
+
+The planner models each backend's cost as a fixed overhead plus a per-element
+cost, measured by a short micro-benchmark and cached on disk. For each batch
+it picks the cheapest backend for the batch size, operand types and available
+cores, and records why.
+
+Run ``python -m calculator.planner`` to calibrate ahead of first use.
+"""
+
+import json
+import os
+import pickle
+import sys
+import tempfile
+import time
+from collections import namedtuple
+from importlib.util import find_spec
+
+from .batch import (
+    STATUS_DIVIDE_BY_ZERO,
+    STATUS_OUT_OF_RANGE,
+    BatchResult,
+    run_batch,
+)
+from .calculator import OPERATION_NAMES, Calculator, resolve_opcode
+
+BACKENDS = ("scalar", "vectorized", "parallel")
+
+# Batches smaller than this always run on the scalar methods, without
+# loading or measuring a calibration.
+SCALAR_FLOOR = 1000
+
+# Methods the vectorized backend reimplements; a calculator overriding any of
+# them must run its own code.
+_VECTORIZED_METHODS = OPERATION_NAMES + ("validate_input", "_validate_inputs")
+
+CACHE_ENV_VAR = "CALCULATOR_PLANNER_CACHE"
+
+Plan = namedtuple("Plan", ["backend", "size", "dtype", "workers", "reasons"])
+Plan.__doc__ = """Execution decision for one batch.
+
+reasons lists, in order, why each backend was taken or passed over.
+"""
+
+Calibration = namedtuple(
+    "Calibration",
+    [
+        "scalar_per_element",
+        "vectorized_overhead",
+        "vectorized_per_element",
+        "parallel_overhead",
+        "transfer_per_element",
+    ],
+)
+Calibration.__doc__ = """Measured backend costs in seconds.
+
+vectorized fields are None when NumPy is not installed.
+"""
+
+
+def default_cache_path():
+    """Return the calibration cache path, honouring CALCULATOR_PLANNER_CACHE."""
+    path = os.environ.get(CACHE_ENV_VAR)
+    if path:
+        return path
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(base, "calculator", "planner.json")
+
+
+def available_cores():
+    """Return the number of cores this process may run on."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def numpy_available():
+    """Return True if NumPy can be imported, without importing it."""
+    return find_spec("numpy") is not None
+
+
+def detect_dtype(*columns):
+    """Classify operand columns as "int", "float" or "object".
+
+    NumPy arrays are classified from their dtype; other sequences from the
+    types of their elements.
+    """
+    kinds = set()
+    for column in columns:
+        dtype = getattr(column, "dtype", None)
+        if dtype is not None:
+            kinds.add({"i": int, "u": int, "b": int, "f": float}.get(dtype.kind))
+        else:
+            kinds.update(map(type, column))
+    if kinds <= {int}:
+        return "int"
+    if kinds <= {int, float}:
+        return "float"
+    return "object"
+
+
+def _environment_key(workers):
+    return {
+        "python": sys.version.split()[0],
+        "numpy": numpy_available(),
+        "workers": workers,
+    }
+
+
+def _best_time(function, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _sample_operands(size):
+    a_values = [float(i % 2000 - 1000) for i in range(size)]
+    b_values = [float(i % 997 + 1) for i in range(size)]
+    return a_values, b_values
+
+
+def calibrate(workers=None, sample_size=20000):
+    """Measure per-backend costs on this machine.
+
+    Args:
+        workers: Process count used for the parallel backend
+        sample_size: Operand pairs used to measure per-element costs
+
+    Returns:
+        Calibration with the measured costs
+    """
+    workers = workers or available_cores()
+    calculator = Calculator()
+    a_values, b_values = _sample_operands(sample_size)
+    scalar = _best_time(lambda: run_batch(calculator, "add", a_values, b_values))
+    scalar_per_element = scalar / sample_size
+
+    vectorized_overhead = vectorized_per_element = None
+    if numpy_available():
+        small_a, small_b = _sample_operands(16)
+        small = _best_time(lambda: vectorized_batch(calculator, 0, small_a, small_b))
+        large = _best_time(lambda: vectorized_batch(calculator, 0, a_values, b_values))
+        vectorized_per_element = max(large - small, 0.0) / (sample_size - 16)
+        vectorized_overhead = max(small - 16 * vectorized_per_element, 0.0)
+
+    transfer = _best_time(
+        lambda: pickle.loads(pickle.dumps((a_values, b_values, a_values)))
+    )
+    from concurrent.futures import ProcessPoolExecutor
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(abs, range(workers)))
+    parallel_overhead = time.perf_counter() - start
+
+    return Calibration(
+        scalar_per_element,
+        vectorized_overhead,
+        vectorized_per_element,
+        parallel_overhead,
+        transfer / sample_size,
+    )
+
+
+def vectorized_batch(calculator, opcode, a_values, b_values):
+    """Run an operation over whole columns with NumPy.
+
+    Results, status codes and error messages match the scalar methods.
+    Operands are handled as float64, so this path is only used for int and
+    float columns; columns holding ints too large for float64 run on the
+    scalar methods instead.
+    """
+    import numpy
+
+    try:
+        a = numpy.asarray(a_values, dtype=numpy.float64)
+        b = numpy.asarray(b_values, dtype=numpy.float64)
+    except OverflowError:
+        return run_batch(calculator, OPERATION_NAMES[opcode], a_values, b_values)
+    low = calculator.MIN_VALUE
+    high = calculator.MAX_VALUE
+    a_bad = (a < low) | (a > high)
+    b_bad = (b < low) | (b > high)
+    out_of_range = a_bad | b_bad
+    statuses = numpy.where(out_of_range, STATUS_OUT_OF_RANGE, 0).astype(numpy.int8)
+    with numpy.errstate(all="ignore"):
+        if opcode == 0:
+            values = a + b
+        elif opcode == 1:
+            values = a - b
+        elif opcode == 2:
+            values = a * b
+            # float64 gives -0.0 for 0 * -5 where Python ints give 0, so zero
+            # products are recomputed with the operands' own types.
+            for index in numpy.flatnonzero(values == 0).tolist():
+                values[index] = a_values[index] * b_values[index]
+        else:
+            zero = (b == 0) & ~out_of_range
+            statuses[zero] = STATUS_DIVIDE_BY_ZERO
+            values = a / numpy.where(zero, 1.0, b)
+    values[statuses != 0] = 0.0
+
+    result = BatchResult.for_calculator(calculator)
+    result.values.frombytes(values.tobytes())
+    result.statuses.frombytes(statuses.tobytes())
+    for index in numpy.flatnonzero(out_of_range).tolist():
+        operand = a_values[index] if a_bad[index] else b_values[index]
+        result.set_error(index, STATUS_OUT_OF_RANGE, operand)
+    return result
+
+
+def _uses_base_methods(calculator):
+    cls = type(calculator)
+    return all(
+        getattr(cls, name) is getattr(Calculator, name) for name in _VECTORIZED_METHODS
+    )
+
+
+def _pickled(calculator):
+    try:
+        return pickle.dumps(calculator)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return None
+
+
+def _parallel_chunk(payload, operation, a_values, b_values):
+    return run_batch(pickle.loads(payload), operation, a_values, b_values)
+
+
+class ExecutionPlanner:
+    """Choose and run the cheapest backend for each batch.
+
+    Calibration happens on first use unless one is given; the result
+    is cached on disk and reused while the Python version, NumPy
+    availability and worker count are unchanged.
+    """
+
+    def __init__(self, calibration=None, cache_path=None, max_workers=None):
+        """Create a planner.
+
+        Args:
+            calibration: Calibration to use instead of measuring or loading
+            cache_path: File for cached calibration, see default_cache_path
+            max_workers: Process count for the parallel backend
+        """
+        self.cache_path = cache_path or default_cache_path()
+        self.workers = max_workers or available_cores()
+        self._calibration = calibration
+        self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Shut down the process pool, if one was started."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    @property
+    def calibration(self):
+        """Calibration in use, loaded from cache or measured on first access."""
+        if self._calibration is None:
+            self._calibration = self._load_calibration()
+        if self._calibration is None:
+            self.recalibrate()
+        return self._calibration
+
+    def recalibrate(self):
+        """Measure backend costs now and write them to the cache."""
+        self._calibration = calibrate(self.workers)
+        self._save_calibration(self._calibration)
+        return self._calibration
+
+    def _load_calibration(self):
+        try:
+            with open(self.cache_path) as cache_file:
+                data = json.load(cache_file)
+        except (OSError, ValueError):
+            return None
+        if data.get("environment") != _environment_key(self.workers):
+            return None
+        try:
+            return Calibration(**data["calibration"])
+        except (KeyError, TypeError):
+            return None
+
+    def _save_calibration(self, calibration):
+        data = {
+            "environment": _environment_key(self.workers),
+            "calibration": calibration._asdict(),
+        }
+        # Write a sibling temp file and rename it over the cache, so other
+        # processes never read a partly written file.
+        directory = os.path.dirname(os.path.abspath(self.cache_path))
+        try:
+            os.makedirs(directory, exist_ok=True)
+            descriptor, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            try:
+                with os.fdopen(descriptor, "w") as cache_file:
+                    json.dump(data, cache_file, indent=2)
+                os.replace(temp_path, self.cache_path)
+            except OSError:
+                os.unlink(temp_path)
+                raise
+        except OSError:
+            pass
+
+    def estimate(self, size):
+        """Return the modelled seconds per available backend for size pairs."""
+        costs = self.calibration
+        estimates = {"scalar": size * costs.scalar_per_element}
+        if costs.vectorized_per_element is not None and numpy_available():
+            estimates["vectorized"] = (
+                costs.vectorized_overhead + size * costs.vectorized_per_element
+            )
+        if self.workers > 1:
+            estimates["parallel"] = costs.parallel_overhead + size * (
+                costs.scalar_per_element / self.workers + costs.transfer_per_element
+            )
+        return estimates
+
+    def thresholds(self):
+        """Return the smallest batch size at which each backend beats scalar.
+
+        Backends that are unavailable, or never cheaper, map to None.
+        """
+        costs = self.calibration
+        per_element = {"scalar": costs.scalar_per_element}
+        overhead = {}
+        if costs.vectorized_per_element is not None and numpy_available():
+            per_element["vectorized"] = costs.vectorized_per_element
+            overhead["vectorized"] = costs.vectorized_overhead
+        if self.workers > 1:
+            per_element["parallel"] = (
+                costs.scalar_per_element / self.workers + costs.transfer_per_element
+            )
+            overhead["parallel"] = costs.parallel_overhead
+        thresholds = {"scalar": 0, "vectorized": None, "parallel": None}
+        for backend, fixed in overhead.items():
+            saving = costs.scalar_per_element - per_element[backend]
+            if saving > 0:
+                thresholds[backend] = int(fixed / saving) + 1
+        return thresholds
+
+    def plan(self, a_values, b_values=None, calculator=None):
+        """Decide how to run a batch without running it.
+
+        Batches below SCALAR_FLOOR pairs go to the scalar backend without
+        touching the calibration.
+
+        Args:
+            a_values: First operand column
+            b_values: Second operand column, included in the dtype check
+            calculator: Calculator that will run the batch; vectorized is
+                skipped if it overrides the operations, parallel if it
+                cannot be pickled
+
+        Returns:
+            Plan with the chosen backend and the reasons for it
+        """
+        columns = (a_values,) if b_values is None else (a_values, b_values)
+        size = len(a_values)
+        dtype = detect_dtype(*columns)
+        if size < SCALAR_FLOOR:
+            reason = f"scalar chosen: fewer than {SCALAR_FLOOR} pairs"
+            return Plan("scalar", size, dtype, 1, [reason])
+        estimates = self.estimate(size)
+        reasons = []
+        if "vectorized" not in estimates:
+            reasons.append("vectorized unavailable: NumPy is not installed")
+        elif dtype == "object":
+            estimates.pop("vectorized")
+            reasons.append("vectorized skipped: operands are not all int/float")
+        elif calculator is not None and not _uses_base_methods(calculator):
+            estimates.pop("vectorized")
+            reasons.append("vectorized skipped: calculator overrides its methods")
+        if "parallel" not in estimates:
+            reasons.append("parallel unavailable: only one worker")
+        elif calculator is not None and _pickled(calculator) is None:
+            estimates.pop("parallel")
+            reasons.append("parallel skipped: calculator cannot be pickled")
+        else:
+            reasons.append(f"parallel would use {self.workers} workers")
+        for backend, seconds in sorted(estimates.items(), key=lambda item: item[1]):
+            reasons.append(f"{backend} estimated at {seconds * 1e3:.3f} ms")
+        backend = min(estimates, key=estimates.get)
+        workers = self.workers if backend == "parallel" else 1
+        return Plan(backend, size, dtype, workers, reasons)
+
+    def explain(self, a_values, b_values=None, calculator=None):
+        """Return a human-readable account of the plan for a batch."""
+        plan = self.plan(a_values, b_values, calculator)
+        lines = [
+            f"backend={plan.backend} size={plan.size} dtype={plan.dtype} "
+            f"workers={plan.workers}"
+        ]
+        lines.extend(f"  - {reason}" for reason in plan.reasons)
+        for backend, size in self.thresholds().items():
+            if backend != "scalar":
+                beats = "never" if size is None else f"from {size} pairs"
+                lines.append(f"  - {backend} beats scalar {beats}")
+        return "\n".join(lines)
+
+    def execute(self, calculator, op, a_values, b_values, backend=None):
+        """Run an operation over operand columns on the planned backend.
+
+        Args:
+            calculator: Calculator providing range limits and methods
+            op: Operation name, symbol, Operation member or opcode
+            a_values: First operand column
+            b_values: Second operand column
+            backend: Force "scalar", "vectorized" or "parallel"
+
+        Returns:
+            BatchResult with one row per operand pair
+
+        Raises:
+            ValueError: If op or backend is unknown, or the columns have
+                different lengths
+        """
+        opcode = resolve_opcode(op)
+        if len(a_values) != len(b_values):
+            raise ValueError("a_values and b_values must have the same length")
+        if backend is None:
+            backend = self.plan(a_values, b_values, calculator).backend
+        if backend == "scalar":
+            return run_batch(calculator, OPERATION_NAMES[opcode], a_values, b_values)
+        if backend == "vectorized":
+            return vectorized_batch(calculator, opcode, a_values, b_values)
+        if backend == "parallel":
+            return self._execute_parallel(calculator, opcode, a_values, b_values)
+        raise ValueError(f"Unknown backend: {backend!r}")
+
+    def _execute_parallel(self, calculator, opcode, a_values, b_values):
+        # The calculator is pickled once and rebuilt in every chunk, so
+        # per-instance range limits and lookup tables carry over.
+        from concurrent.futures import ProcessPoolExecutor
+
+        payload = pickle.dumps(calculator)
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        a_values = list(a_values)
+        b_values = list(b_values)
+        size = len(a_values)
+        chunk = max(1, -(-size // (self.workers * 4)))
+        starts = range(0, size, chunk)
+        futures = [
+            self._executor.submit(
+                _parallel_chunk,
+                payload,
+                OPERATION_NAMES[opcode],
+                a_values[start : start + chunk],
+                b_values[start : start + chunk],
+            )
+            for start in starts
+        ]
+        result = BatchResult.for_calculator(calculator)
+        for future in futures:
+            result.extend(future.result())
+        return result
+
+
+if __name__ == "__main__":
+    planner = ExecutionPlanner()
+    planner.recalibrate()
+    print(f"Calibration written to {planner.cache_path}")
+    for size in (10, 1000, 100000, 1000000):
+        print(planner.explain(range(size)))
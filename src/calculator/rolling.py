@@ -0,0 +1,180 @@
+"""
+Rolling-window aggregates over streaming operands.
+"""
+
+import math
+import operator
+from collections import deque
+
+from .calculator import Calculator
+
+
+class _RollingWindow:
+    """Base class holding the window length and validating each element."""
+
+    def __init__(self, size, calculator=None):
+        if size < 1:
+            raise ValueError("Window size must be at least 1")
+        self.size = size
+        self.calculator = calculator or Calculator()
+        self._count = 0
+
+    def __len__(self):
+        return min(self._count, self.size)
+
+    @property
+    def is_full(self):
+        """True once the window holds size elements."""
+        return self._count >= self.size
+
+    def extend(self, values):
+        """Push every value in order and return the final aggregate."""
+        result = None
+        for value in values:
+            result = self.push(value)
+        return result
+
+    def _require_values(self):
+        if self._count == 0:
+            raise ValueError("Window is empty")
+
+
+class RollingSum(_RollingWindow):
+    """Moving sum over the last size elements.
+
+    Elements are kept in a ring buffer so each push adds the new element and
+    subtracts the evicted one. Float sums use Neumaier compensation and are
+    recomputed exactly with ``math.fsum`` every resync_interval pushes to
+    stop rounding error accumulating in long-running streams.
+    """
+
+    def __init__(self, size, calculator=None, resync_interval=None):
+        """Create a moving sum.
+
+        Args:
+            size: Number of elements in the window
+            calculator: Calculator whose range is applied to each element
+            resync_interval: Pushes between exact recomputations, defaults
+                to size so the recomputation cost stays O(1) amortized
+
+        Raises:
+            ValueError: If size or resync_interval is less than 1
+        """
+        super().__init__(size, calculator)
+        if resync_interval is None:
+            resync_interval = size
+        if resync_interval < 1:
+            raise ValueError("Resync interval must be at least 1")
+        self.resync_interval = resync_interval
+        self._buffer = deque(maxlen=size)
+        self._sum = 0
+        self._compensation = 0
+        self._inexact = False
+        self._since_resync = 0
+
+    def _accumulate(self, value):
+        total = self._sum + value
+        if abs(self._sum) >= abs(value):
+            self._compensation += (self._sum - total) + value
+        else:
+            self._compensation += (value - total) + self._sum
+        self._sum = total
+
+    def push(self, value):
+        """Add an element to the window and return the current aggregate.
+
+        Raises:
+            InvalidInputException: If value is outside the calculator's range
+        """
+        self.calculator.validate_input(value)
+        buffer = self._buffer
+        if len(buffer) == self.size:
+            self._accumulate(-buffer[0])
+        buffer.append(value)
+        self._accumulate(value)
+        self._count += 1
+        if not isinstance(value, int):
+            self._inexact = True
+        if self._inexact:
+            self._since_resync += 1
+            if self._since_resync >= self.resync_interval:
+                self.resync()
+        return self.value
+
+    def resync(self):
+        """Recompute the sum exactly from the buffered elements."""
+        self._sum = math.fsum(self._buffer)
+        self._compensation = 0
+        self._since_resync = 0
+
+    @property
+    def value(self):
+        """Sum of the elements currently in the window."""
+        return self._sum + self._compensation
+
+
+class RollingMean(RollingSum):
+    """Moving average over the last size elements."""
+
+    @property
+    def value(self):
+        """Mean of the elements currently in the window.
+
+        Raises:
+            ValueError: If the window is empty
+        """
+        self._require_values()
+        return (self._sum + self._compensation) / len(self._buffer)
+
+
+class _RollingExtreme(_RollingWindow):
+    """Moving extreme tracked with a monotonic deque of (position, value).
+
+    Subclasses set _keeps to the comparison under which a buffered candidate
+    survives the arrival of a new element.
+    """
+
+    _keeps = None
+
+    def __init__(self, size, calculator=None):
+        super().__init__(size, calculator)
+        self._candidates = deque()
+
+    def push(self, value):
+        """Add an element to the window and return the current extreme.
+
+        Raises:
+            InvalidInputException: If value is outside the calculator's range
+        """
+        self.calculator.validate_input(value)
+        candidates = self._candidates
+        keeps = self._keeps
+        while candidates and not keeps(candidates[-1][1], value):
+            candidates.pop()
+        candidates.append((self._count, value))
+        self._count += 1
+        if candidates[0][0] <= self._count - 1 - self.size:
+            candidates.popleft()
+        return candidates[0][1]
+
+    @property
+    def value(self):
+        """Extreme of the elements currently in the window.
+
+        Raises:
+            ValueError: If the window is empty
+        """
+        self._require_values()
+        return self._candidates[0][1]
+
+
+class RollingMin(_RollingExtreme):
+    """Moving minimum over the last size elements."""
+
+    _keeps = staticmethod(operator.lt)
+
+
+class RollingMax(_RollingExtreme):
+    """Moving maximum over the last size elements."""
+
+    _keeps = staticmethod(operator.gt)
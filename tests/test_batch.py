@@ -0,0 +1,231 @@
+"""
+Test suite for the BatchResult container.
+"""
+
+import pytest
+from src.calculator.batch import (
+    STATUS_DIVIDE_BY_ZERO,
+    STATUS_OK,
+    STATUS_OUT_OF_RANGE,
+    BatchResult,
+    run_batch,
+)
+from src.calculator.calculator import Calculator, InvalidInputException
+
+
+@pytest.fixture
+def calc():
+    """Create a calculator instance for tests."""
+    return Calculator()
+
+
+class TestBatchResult:
+    """Tests for the BatchResult container."""
+
+    def test_append_value_stores_value_and_ok_status(self):
+        """Test that appended values are stored with an ok status."""
+        # Arrange
+        result = BatchResult()
+
+        # Act
+        result.append_value(2.5)
+
+        # Assert
+        assert len(result) == 1
+        assert result[0] == 2.5
+        assert result.statuses[0] == STATUS_OK
+
+    def test_getitem_raises_materialized_error(self):
+        """Test that indexing a failed row raises its exception."""
+        # Arrange
+        result = BatchResult()
+        result.append_error(STATUS_OUT_OF_RANGE, 1000001)
+
+        # Act & Assert
+        with pytest.raises(InvalidInputException) as exc_info:
+            result[0]
+        assert "1000001" in str(exc_info.value)
+
+    def test_out_of_range_message_matches_calculator(self, calc):
+        """Test that out-of-range messages match the scalar Calculator."""
+        # Arrange
+        result = BatchResult()
+        result.append_error(STATUS_OUT_OF_RANGE, -1000001)
+        with pytest.raises(InvalidInputException) as exc_info:
+            calc.add(-1000001, 1)
+
+        # Act
+        message = result.message(0)
+
+        # Assert
+        assert message == str(exc_info.value)
+
+    def test_divide_by_zero_error_is_value_error(self):
+        """Test that divide-by-zero rows materialize a ValueError."""
+        # Arrange
+        result = BatchResult()
+        result.append_error(STATUS_DIVIDE_BY_ZERO)
+
+        # Act
+        error = result.error(0)
+
+        # Assert
+        assert isinstance(error, ValueError)
+        assert str(error) == "Cannot divide by zero"
+
+    def test_ok_row_has_no_error(self):
+        """Test that successful rows report no error or message."""
+        # Arrange
+        result = BatchResult()
+        result.append_value(1.0)
+
+        # Act & Assert
+        assert result.error(0) is None
+        assert result.message(0) is None
+
+    def test_append_error_rejects_ok_status(self):
+        """Test that append_error refuses the ok status."""
+        # Arrange
+        result = BatchResult()
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            result.append_error(STATUS_OK)
+
+    def test_preallocated_rows_start_ok(self, calc):
+        """Test that preallocated rows are ok with a zero value."""
+        # Act
+        result = BatchResult.for_calculator(calc, 3)
+
+        # Assert
+        assert list(result.values) == [0.0, 0.0, 0.0]
+        assert result.error_count == 0
+
+    def test_set_error_marks_preallocated_row(self, calc):
+        """Test that set_error records a failure at a given row."""
+        # Arrange
+        result = BatchResult.for_calculator(calc, 2)
+
+        # Act
+        result.set_error(1, STATUS_OUT_OF_RANGE, 1000001)
+
+        # Assert
+        assert result.error_indices() == [1]
+        assert "1000001" in result.message(1)
+
+    def test_set_error_rejects_ok_status(self, calc):
+        """Test that set_error refuses the ok status."""
+        # Arrange
+        result = BatchResult.for_calculator(calc, 1)
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            result.set_error(0, STATUS_OK)
+
+    def test_extend_offsets_error_operands(self):
+        """Test that extending keeps error operands aligned with their rows."""
+        # Arrange
+        first = BatchResult()
+        first.append_value(1.0)
+        second = BatchResult()
+        second.append_error(STATUS_OUT_OF_RANGE, 2000000)
+
+        # Act
+        first.extend(second)
+
+        # Assert
+        assert len(first) == 2
+        assert "2000000" in first.message(1)
+
+    def test_error_count_and_indices(self):
+        """Test counting and locating failed rows."""
+        # Arrange
+        result = BatchResult()
+        result.append_value(1.0)
+        result.append_error(STATUS_DIVIDE_BY_ZERO)
+        result.append_value(2.0)
+        result.append_error(STATUS_OUT_OF_RANGE, 1000001)
+
+        # Act & Assert
+        assert result.error_count == 2
+        assert result.error_indices() == [1, 3]
+
+    def test_values_support_buffer_protocol(self):
+        """Test that the values column can be viewed without copying."""
+        # Arrange
+        result = BatchResult()
+        result.append_value(1.5)
+        result.append_value(-2.5)
+
+        # Act
+        view = memoryview(result.values)
+
+        # Assert
+        assert view.format == "d"
+        assert view.tolist() == [1.5, -2.5]
+
+    def test_tofile_writes_raw_columns(self, tmp_path):
+        """Test that columns are written as raw binary data."""
+        # Arrange
+        result = BatchResult()
+        result.append_value(1.0)
+        result.append_error(STATUS_DIVIDE_BY_ZERO)
+        values_path = tmp_path / "values.bin"
+        statuses_path = tmp_path / "statuses.bin"
+
+        # Act
+        with open(values_path, "wb") as values_file, open(
+            statuses_path, "wb"
+        ) as statuses_file:
+            result.tofile(values_file, statuses_file)
+
+        # Assert
+        assert values_path.stat().st_size == 2 * result.values.itemsize
+        assert statuses_path.read_bytes() == bytes([STATUS_OK, STATUS_DIVIDE_BY_ZERO])
+
+
+class TestRunBatch:
+    """Tests for the run_batch helper."""
+
+    def test_run_batch_matches_scalar_results(self, calc):
+        """Test that run_batch produces the scalar results."""
+        # Arrange
+        a_values = [5, -5, 2.5]
+        b_values = [3, 3, 3.7]
+
+        # Act
+        result = run_batch(calc, "add", a_values, b_values)
+
+        # Assert
+        assert list(result.values) == [8, -2, pytest.approx(6.2)]
+        assert result.error_count == 0
+
+    def test_run_batch_encodes_errors(self, calc):
+        """Test that run_batch records failures instead of raising."""
+        # Arrange
+        a_values = [10, 5, 1]
+        b_values = [0, 1000001, 2]
+
+        # Act
+        result = run_batch(calc, "divide", a_values, b_values)
+
+        # Assert
+        assert list(result.statuses) == [
+            STATUS_DIVIDE_BY_ZERO,
+            STATUS_OUT_OF_RANGE,
+            STATUS_OK,
+        ]
+        assert "1000001" in result.message(1)
+        assert result[2] == 0.5
+
+    def test_to_list_matches_scalar_exceptions(self, calc):
+        """Test that to_list yields values and exception instances."""
+        # Arrange
+        result = run_batch(calc, "divide", [4, 4], [2, 0])
+
+        # Act
+        items = result.to_list()
+
+        # Assert
+        assert items[0] == 2.0
+        assert isinstance(items[1], ValueError)
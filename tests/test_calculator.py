@@ -3,7 +3,8 @@ Test suite for the Calculator class.
 """
 
 import pytest
-from src.calculator.calculator import Calculator, InvalidInputException
+from src.calculator.calculator import Calculator, InvalidInputException, Operation
+from src.calculator.lookup import TabledCalculator
 
 
 @pytest.fixture
@@ -732,3 +733,133 @@ class TestDivision:
             calc.divide(a, b)
         assert "1000001" in str(exc_info.value)
         assert "outside valid range" in str(exc_info.value).lower()
+
+
+class TestValidateInput:
+    """Tests for the single-value range check."""
+
+    @pytest.mark.parametrize("value", [-1000000, 0, 1000000])
+    def test_value_in_range_passes(self, calc, value):
+        """Test that values inside the range are accepted."""
+        # Act & Assert
+        calc.validate_input(value)
+
+    def test_value_out_of_range_raises(self, calc):
+        """Test that a value outside the range raises InvalidInputException."""
+        # Act & Assert
+        with pytest.raises(InvalidInputException, match="1000001"):
+            calc.validate_input(1000001)
+
+
+class TestApply:
+    """Tests for the apply and apply_many methods."""
+
+    @pytest.mark.parametrize(
+        "op",
+        ["multiply", "*", Operation.MULTIPLY, 2],
+        ids=["name", "symbol", "enum", "int"],
+    )
+    def test_apply_accepts_every_operation_spelling(self, calc, op):
+        """Test that names, symbols, enum members and opcodes dispatch alike."""
+        # Act
+        result = calc.apply(op, 4, 5)
+
+        # Assert
+        assert result == 20
+
+    def test_apply_unknown_operation_raises_value_error(self, calc):
+        """Test that an unknown operation raises ValueError."""
+        # Act & Assert
+        with pytest.raises(ValueError, match="Unknown operation"):
+            calc.apply("power", 2, 3)
+
+    @pytest.mark.parametrize("op", [True, 1.0, None], ids=["bool", "float", "none"])
+    def test_apply_rejects_non_operation_types(self, calc, op):
+        """Test that only strings and ints resolve to operations."""
+        # Act & Assert
+        with pytest.raises(ValueError, match="Unknown operation"):
+            calc.apply(op, 4, 5)
+
+    def test_apply_propagates_calculator_errors(self, calc):
+        """Test that apply raises the same errors as the direct methods."""
+        # Act & Assert
+        with pytest.raises(ValueError, match="Cannot divide by zero"):
+            calc.apply(Operation.DIVIDE, 1, 0)
+        with pytest.raises(InvalidInputException):
+            calc.apply("add", 1000001, 1)
+
+    def test_apply_uses_subclass_methods(self):
+        """Test that apply dispatches to a subclass's own methods."""
+        # Arrange
+        tabled = TabledCalculator(10, operations=("multiply",))
+        tabled._products[3][4] = 99
+
+        # Act
+        result = tabled.apply(Operation.MULTIPLY, 3, 4)
+
+        # Assert
+        assert result == 99
+
+    def test_apply_many_single_operation(self, calc):
+        """Test that a single operation is applied to every pair."""
+        # Act
+        result = calc.apply_many("-", [5, 10, 1000001], [3, 4, 1])
+
+        # Assert
+        assert result[0] == 2
+        assert result[1] == 6
+        assert "1000001" in result.message(2)
+
+    def test_apply_many_mixed_operations_match_scalar(self, calc):
+        """Test that mixed batches match per-record scalar results."""
+        # Arrange
+        ops = ["add", Operation.DIVIDE, 2, "-", "/", "multiply"]
+        a_values = [1, 6, 3, 10, 5, 2.5]
+        b_values = [2, 3, 4, 1, 0, 4]
+
+        # Act
+        result = calc.apply_many(ops, a_values, b_values)
+
+        # Assert
+        assert result.to_list()[:4] == [3, 2.0, 12, 9]
+        assert isinstance(result.error(4), ValueError)
+        assert result[5] == 10.0
+
+    def test_apply_many_length_mismatch_raises_value_error(self, calc):
+        """Test that ops and operands must have the same length."""
+        # Act & Assert
+        with pytest.raises(ValueError):
+            calc.apply_many(["add", "add"], [1], [2])
+
+    def test_apply_many_single_operation_length_mismatch_raises_value_error(self, calc):
+        """Test that a single operation also requires equal operand lengths."""
+        # Act & Assert
+        with pytest.raises(ValueError, match="same length"):
+            calc.apply_many("add", [1, 2], [3])
+
+    def test_apply_many_unknown_operation_raises_value_error(self, calc):
+        """Test that an unknown operation in a mixed batch raises ValueError."""
+        # Act & Assert
+        with pytest.raises(ValueError, match="Unknown operation"):
+            calc.apply_many(["add", "mod"], [1, 2], [3, 4])
+
+    @pytest.mark.parametrize("bad", [1.0, True])
+    def test_apply_many_rejects_ops_equal_to_valid_opcodes(self, calc, bad):
+        """Test that 1.0 and True are rejected even next to a valid 1."""
+        # Act & Assert
+        with pytest.raises(ValueError, match="Unknown operation"):
+            calc.apply_many(["add", 1, bad], [5] * 3, [2] * 3)
+        with pytest.raises(ValueError, match="Unknown operation"):
+            calc.apply_many([bad, "add", 1], [5] * 3, [2] * 3)
+
+    def test_apply_many_single_non_operation_raises_value_error(self, calc):
+        """Test that a single float operation is rejected, not iterated."""
+        # Act & Assert
+        with pytest.raises(ValueError, match="Unknown operation"):
+            calc.apply_many(1.0, [5], [2])
+
+    def test_apply_many_unhashable_operation_raises_value_error(self, calc):
+        """Test that an unhashable operation raises ValueError."""
+        # Act & Assert
+        with pytest.raises(ValueError, match="Unknown operation"):
+            calc.apply_many(["add", ["add"]], [1, 2], [3, 4])
@@ -0,0 +1,230 @@
+"""
+Test suite for operand parsing and coercion.
+"""
+
+from decimal import Decimal
+
+import pytest
+from src.calculator.batch import (
+    STATUS_DIVIDE_BY_ZERO,
+    STATUS_OK,
+    STATUS_OUT_OF_RANGE,
+    STATUS_PARSE_ERROR,
+)
+from src.calculator.calculator import Calculator, InvalidInputException
+from src.calculator.coercion import (
+    CACHE_LIMIT,
+    calculate_column,
+    coerce_column,
+    parse_number,
+)
+
+
+@pytest.fixture
+def calc():
+    """Create a calculator instance for tests."""
+    return Calculator()
+
+
+class TestParseNumber:
+    """Tests for the parse_number function."""
+
+    def test_parse_integer_text_returns_int(self):
+        """Test that integer literals stay integers."""
+        # Act
+        result = parse_number(" -42 ")
+
+        # Assert
+        assert result == -42
+        assert isinstance(result, int)
+
+    def test_parse_float_text_returns_float(self):
+        """Test that decimal and exponent literals become floats."""
+        # Act & Assert
+        assert parse_number("2.5") == 2.5
+        assert parse_number("1e3") == 1000.0
+
+    def test_parse_invalid_text_raises_value_error(self):
+        """Test that non-numeric text raises ValueError."""
+        # Act & Assert
+        with pytest.raises(ValueError):
+            parse_number("abc")
+
+    @pytest.mark.parametrize("text", ["nan", "-NaN", "1_000", "1_0.5"])
+    def test_parse_nan_and_underscores_raise_value_error(self, text):
+        """Test that NaN and underscore literals are not operands."""
+        # Act & Assert
+        with pytest.raises(ValueError):
+            parse_number(text)
+
+
+class TestCoerceColumn:
+    """Tests for the coerce_column function."""
+
+    def test_numeric_column_is_returned_unchanged(self):
+        """Test that pre-typed columns skip conversion."""
+        # Arrange
+        column = [1, 2.5, -3]
+
+        # Act
+        values, errors = coerce_column(column)
+
+        # Assert
+        assert values == column
+        assert errors == {}
+
+    def test_string_column_reports_errors_by_row(self):
+        """Test that unparseable strings are reported with their row."""
+        # Arrange
+        column = ["1", "x", "2.5", ""]
+
+        # Act
+        values, errors = coerce_column(column)
+
+        # Assert
+        assert values == [1, None, 2.5, None]
+        assert errors == {1: "x", 3: ""}
+
+    def test_repeated_literals_share_cached_value(self):
+        """Test that repeated literals are parsed once and reused."""
+        # Arrange
+        cache = {}
+        column = ["123456789", "123456789"]
+
+        # Act
+        values, _ = coerce_column(column, cache)
+
+        # Assert
+        assert values[0] is values[1]
+        assert cache == {"123456789": 123456789}
+
+    def test_distinct_literals_skip_cache(self):
+        """Test that a column of distinct literals does not fill the cache."""
+        # Arrange
+        cache = {}
+        column = [str(value) for value in range(1000)]
+
+        # Act
+        values, _ = coerce_column(column, cache)
+
+        # Assert
+        assert values == list(range(1000))
+        assert cache == {}
+
+    def test_cache_stops_growing_at_limit(self):
+        """Test that the shared cache is bounded by CACHE_LIMIT."""
+        # Arrange
+        cache = {str(-value): -value for value in range(1, CACHE_LIMIT)}
+        column = ["1", "1", "2", "2"]
+
+        # Act
+        values, _ = coerce_column(column, cache)
+
+        # Assert
+        assert values == [1, 1, 2, 2]
+        assert len(cache) == CACHE_LIMIT
+
+    def test_mixed_column_coerces_decimals(self):
+        """Test that mixed columns convert Decimal and text values."""
+        # Arrange
+        column = [1, 2.5, Decimal("3"), Decimal("0.5"), "7", None]
+
+        # Act
+        values, errors = coerce_column(column)
+
+        # Assert
+        assert values == [1, 2.5, 3, 0.5, 7, None]
+        assert isinstance(values[2], int)
+        assert errors == {5: None}
+
+    def test_bad_decimals_are_reported_not_raised(self):
+        """Test that signaling NaN Decimals become per-row errors."""
+        # Arrange
+        column = [1, Decimal("sNaN"), Decimal("Infinity"), Decimal("NaN")]
+
+        # Act
+        values, errors = coerce_column(column)
+
+        # Assert
+        assert values == [1, None, float("inf"), None]
+        assert list(errors) == [1, 3]
+
+    def test_bool_and_subclasses_are_accepted(self):
+        """Test that bools and int subclasses are kept like Calculator does."""
+
+        # Arrange
+        class Count(int):
+            pass
+
+        column = [True, Count(3), "2"]
+
+        # Act
+        values, errors = coerce_column(column)
+
+        # Assert
+        assert values == [True, 3, 2]
+        assert errors == {}
+
+
+class TestCalculateColumn:
+    """Tests for the calculate_column function."""
+
+    def test_text_columns_match_typed_results(self, calc):
+        """Test that text input gives the same results as typed input."""
+        # Arrange
+        a_column = ["5", "2.5", "-10"]
+        b_column = ["3", "3.7", "4"]
+
+        # Act
+        result = calculate_column(calc, "add", a_column, b_column)
+
+        # Assert
+        assert list(result.values) == [
+            calc.add(5, 3),
+            calc.add(2.5, 3.7),
+            calc.add(-10, 4),
+        ]
+
+    def test_row_errors_are_encoded(self, calc):
+        """Test that parse, range and zero-division errors are recorded."""
+        # Arrange
+        a_column = ["1", "oops", "2000000", "8"]
+        b_column = ["0", "1", "1", "2"]
+
+        # Act
+        result = calculate_column(calc, "divide", a_column, b_column)
+
+        # Assert
+        assert list(result.statuses) == [
+            STATUS_DIVIDE_BY_ZERO,
+            STATUS_PARSE_ERROR,
+            STATUS_OUT_OF_RANGE,
+            STATUS_OK,
+        ]
+        assert isinstance(result.error(1), InvalidInputException)
+        assert "'oops'" in result.message(1)
+        assert "2000000" in result.message(2)
+
+    def test_nan_rows_are_parse_errors(self, calc):
+        """Test that NaN text and Decimal NaN are reported, not computed."""
+        # Act
+        result = calculate_column(
+            calc, "add", ["nan", Decimal("NaN"), "1_000", "1"], [1, 1, 1, 1]
+        )
+
+        # Assert
+        assert list(result.statuses) == [STATUS_PARSE_ERROR] * 3 + [STATUS_OK]
+
+    def test_length_mismatch_raises_value_error(self, calc):
+        """Test that columns of different lengths are rejected."""
+        # Act & Assert
+        with pytest.raises(ValueError, match="same length"):
+            calculate_column(calc, "add", ["1", "2"], ["1"])
+
+    def test_decimal_infinity_is_out_of_range(self, calc):
+        """Test that a Decimal infinity is reported as out of range."""
+        # Act
+        result = calculate_column(calc, "add", [Decimal("Infinity"), 1], [1, 1])
+
+        # Assert
+        assert list(result.statuses) == [STATUS_OUT_OF_RANGE, STATUS_OK]
@@ -0,0 +1,165 @@
+"""
+Differential tests of alternative execution engines against the Calculator.
+"""
+
+import pytest
+from src.calculator.calculator import Calculator
+from src.calculator.differential import (
+    ENGINES,
+    OPERATIONS,
+    compare_outcomes,
+    edge_values,
+    format_runs,
+    generate_operands,
+    reference_outcomes,
+    run_differential,
+)
+
+
+@pytest.fixture
+def calc():
+    """Create a calculator instance for tests."""
+    return Calculator()
+
+
+class TestGenerateOperands:
+    """Tests for operand generation."""
+
+    def test_generation_is_deterministic_for_seed(self, calc):
+        """Test that the same seed produces the same operands."""
+        # Act
+        first = generate_operands(100, seed=7, calculator=calc)
+        second = generate_operands(100, seed=7, calculator=calc)
+
+        # Assert
+        assert first == second
+
+    def test_edge_values_straddle_limits(self, calc):
+        """Test that edge values include operands just inside and outside."""
+        # Act
+        values = edge_values(calc)
+
+        # Assert
+        assert any(calc.MAX_VALUE < value < calc.MAX_VALUE + 1 for value in values)
+        assert any(calc.MAX_VALUE - 1 < value < calc.MAX_VALUE for value in values)
+        assert calc.MIN_VALUE - 1 in values
+
+
+class TestRunDifferential:
+    """Tests for the differential harness."""
+
+    @pytest.mark.parametrize("engine", sorted(ENGINES))
+    @pytest.mark.parametrize("operation", OPERATIONS)
+    def test_engine_matches_reference(self, calc, engine, operation):
+        """Test that every registered engine matches the scalar Calculator."""
+        # Act
+        runs = run_differential(
+            calc, {engine: ENGINES[engine]}, operations=(operation,), count=3000
+        )
+
+        # Assert
+        assert runs[0].mismatches == []
+        assert runs[0].seconds >= 0
+
+    def test_broken_engine_is_reported(self, calc):
+        """Test that an engine with wrong results produces mismatches."""
+
+        # Arrange
+        def broken(calculator, operation, a_values, b_values):
+            return [0.0 for _ in a_values]
+
+        # Act
+        runs = run_differential(
+            calc, {"broken": broken}, operations=("add",), count=200
+        )
+
+        # Assert
+        assert runs[0].mismatches
+
+    def test_wrong_exception_message_is_reported(self, calc):
+        """Test that matching exception types with other messages mismatch."""
+
+        # Arrange
+        def renamed(calculator, operation, a_values, b_values):
+            outcomes = []
+            for a, b in zip(a_values, b_values):
+                try:
+                    outcomes.append(calculator.divide(a, b))
+                except ValueError:
+                    outcomes.append(ValueError("division by zero"))
+                except Exception as exc:
+                    outcomes.append(exc)
+            return outcomes
+
+        # Act
+        runs = run_differential(
+            calc, {"renamed": renamed}, operations=("divide",), count=500
+        )
+
+        # Assert
+        assert runs[0].mismatches
+        assert all(
+            isinstance(mismatch.actual, ValueError) for mismatch in runs[0].mismatches
+        )
+
+    def test_sign_of_zero_is_compared(self):
+        """Test that -0.0 and 0.0 are reported as different results."""
+        # Act
+        mismatches = compare_outcomes([0], [0], [-0.0], [0.0])
+
+        # Assert
+        assert len(mismatches) == 1
+
+    def test_result_type_is_compared(self):
+        """Test that 3 and 3.0 differ unless the engine returns floats."""
+        # Act & Assert
+        assert compare_outcomes([1], [2], [3], [3.0])
+        assert compare_outcomes([1], [2], [3], [3.0], returns_floats=True) == []
+
+    def test_lookup_engine_uses_given_calculator(self, calc):
+        """Test that the lookup engine keeps the calculator's own limits."""
+        # Arrange
+        calc.MAX_VALUE = 10
+
+        # Act
+        runs = run_differential(
+            calc, {"lookup": ENGINES["lookup"]}, operations=("multiply",), count=500
+        )
+
+        # Assert
+        assert runs[0].mismatches == []
+
+    def test_engine_setup_runs_once_and_is_cleaned_up(self, calc):
+        """Test that setup runs once per run and its cleanup runs at the end."""
+        # Arrange
+        events = []
+
+        def setup(calculator, stack):
+            events.append("setup")
+            stack.callback(events.append, "cleanup")
+            return reference_outcomes
+
+        def engine(calculator, operation, a_values, b_values):
+            raise AssertionError("setup engine should be timed instead")
+
+        engine.setup = setup
+
+        # Act
+        runs = run_differential(
+            calc, {"prepared": engine}, operations=("add", "subtract"), count=50
+        )
+
+        # Assert
+        assert events == ["setup", "cleanup"]
+        assert [run.mismatches for run in runs] == [[], []]
+
+    def test_format_runs_lists_each_run(self, calc):
+        """Test that the timing table has a row per engine run."""
+        # Arrange
+        runs = run_differential(calc, operations=("add",), count=50)
+
+        # Act
+        table = format_runs(runs)
+
+        # Assert
+        assert len(table.splitlines()) == len(runs) + 1
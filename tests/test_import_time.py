@@ -0,0 +1,114 @@
+"""
+Test suite for the import-time budget of the calculator package.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "src")
+
+# Cumulative time allowed for ``import calculator``, in microseconds.
+IMPORT_BUDGET_US = 20000
+
+# Modules that must not be loaded by a bare ``import calculator``.
+DEFERRED_MODULES = (
+    "calculator.calculator",
+    "calculator.batch",
+    "calculator.coercion",
+    "calculator.differential",
+    "calculator.lookup",
+    "calculator.planner",
+    "calculator.rolling",
+    "array",
+    "decimal",
+    "numpy",
+    "concurrent.futures",
+)
+
+
+def run_python(code, *options):
+    """Run code in a fresh interpreter with src on the path."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = SRC_DIR
+    return subprocess.run(
+        [sys.executable, *options, "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+
+
+def measure_import_time_us(attempts=5):
+    """Return the best cumulative ``import calculator`` time over attempts."""
+    timings = []
+    for _ in range(attempts):
+        completed = run_python("import calculator", "-X", "importtime")
+        for line in completed.stderr.splitlines():
+            fields = [field.strip() for field in line.split("|")]
+            if len(fields) == 3 and fields[2] == "calculator":
+                timings.append(int(fields[1]))
+    return min(timings)
+
+
+class TestImportTime:
+    """Tests for the cost of importing the calculator package."""
+
+    def test_import_within_budget(self):
+        """Test that importing the package stays within the time budget."""
+        # Act
+        cumulative_us = measure_import_time_us()
+
+        # Assert
+        assert cumulative_us <= IMPORT_BUDGET_US
+
+    @pytest.mark.parametrize("module_name", DEFERRED_MODULES)
+    def test_import_does_not_load_deferred_module(self, module_name):
+        """Test that heavy submodules and dependencies load lazily."""
+        # Arrange
+        code = f"import sys, calculator; print({module_name!r} in sys.modules)"
+
+        # Act
+        completed = run_python(code)
+
+        # Assert
+        assert completed.stdout.strip() == "False"
+
+    def test_attribute_access_loads_submodule(self):
+        """Test that accessing an exported name imports its submodule."""
+        # Arrange
+        code = (
+            "import sys, calculator; "
+            "calculator.BatchResult; "
+            "print('calculator.batch' in sys.modules)"
+        )
+
+        # Act
+        completed = run_python(code)
+
+        # Assert
+        assert completed.stdout.strip() == "True"
+
+    def test_unknown_attribute_raises_attribute_error(self):
+        """Test that unknown names raise AttributeError."""
+        # Arrange
+        import src.calculator as package
+
+        # Act & Assert
+        with pytest.raises(AttributeError):
+            package.does_not_exist
+
+    def test_lazy_names_are_listed(self):
+        """Test that lazily exported names appear in dir()."""
+        # Arrange
+        import src.calculator as package
+
+        # Act
+        names = dir(package)
+
+        # Assert
+        assert "Calculator" in names
+        assert "coercion" in names
@@ -0,0 +1,183 @@
+"""
+Test suite for the table-backed TabledCalculator.
+"""
+
+import copy
+import pickle
+
+import pytest
+from src.calculator.calculator import Calculator, InvalidInputException
+from src.calculator.lookup import TabledCalculator, benchmark, estimate_nbytes
+
+
+@pytest.fixture
+def calc():
+    """Create a calculator with lookup tables over [0, 50]."""
+    return TabledCalculator(50)
+
+
+class TestTabledCalculator:
+    """Tests for the lookup-table calculator."""
+
+    def test_multiply_in_domain_uses_table(self, calc):
+        """Test that products inside the domain come from the table."""
+        # Arrange
+        calc._products[12][50] = -1
+
+        # Act
+        result = calc.multiply(12, 50)
+
+        # Assert
+        assert result == -1
+        assert isinstance(result, int)
+
+    def test_tables_match_plain_results(self, calc):
+        """Test that every tabulated result equals the plain result."""
+        # Arrange
+        plain = Calculator()
+        domain = range(51)
+
+        # Act & Assert
+        for a in domain:
+            assert [calc.multiply(a, b) for b in domain] == [
+                plain.multiply(a, b) for b in domain
+            ]
+            assert [calc.divide(a, b) for b in domain[1:]] == [
+                plain.divide(a, b) for b in domain[1:]
+            ]
+
+    def test_divide_in_domain_uses_table(self, calc):
+        """Test that quotients inside the domain match true division."""
+        # Act
+        result = calc.divide(10, 4)
+
+        # Assert
+        assert result == 2.5
+
+    @pytest.mark.parametrize("a, b", [(51, 2), (-3, 2), (2, -3), (1000000, 8)])
+    def test_outside_domain_falls_back(self, calc, a, b):
+        """Test that operands outside the domain use the normal path."""
+        # Act & Assert
+        assert calc.multiply(a, b) == a * b
+        assert calc.divide(a, b) == a / b
+
+    @pytest.mark.parametrize("a, b", [(2.0, 3), (2, 3.0), (True, 3)])
+    def test_non_int_operands_keep_their_result_type(self, calc, a, b):
+        """Test that floats and bools get exactly the plain results."""
+        # Arrange
+        plain = Calculator()
+
+        # Act
+        result = calc.multiply(a, b)
+
+        # Assert
+        assert result == plain.multiply(a, b)
+        assert type(result) is type(plain.multiply(a, b))  # noqa: E721
+
+    def test_divide_by_zero_still_raises(self, calc):
+        """Test that zero divisors in the domain still raise ValueError."""
+        # Act & Assert
+        with pytest.raises(ValueError, match="Cannot divide by zero"):
+            calc.divide(5, 0)
+
+    def test_out_of_range_still_raises(self, calc):
+        """Test that out-of-range inputs still raise InvalidInputException."""
+        # Act & Assert
+        with pytest.raises(InvalidInputException):
+            calc.multiply(1000001, 2)
+
+    def test_footprint_reports_table_sizes(self, calc):
+        """Test that the footprint report covers each table."""
+        # Act
+        report = calc.lookup_table_footprint()
+
+        # Assert
+        assert report["multiply"] == estimate_nbytes(50, ("multiply",))
+        assert report["divide"] == estimate_nbytes(50, ("divide",))
+        assert report["total"] == estimate_nbytes(50)
+
+    def test_single_operation_table(self):
+        """Test that only the requested operations are tabulated."""
+        # Act
+        calculator = TabledCalculator(10, operations=("multiply",))
+
+        # Assert
+        assert "divide" not in calculator.lookup_table_footprint()
+        assert calculator.divide(1, 2) == 0.5
+
+    def test_tabled_calculator_can_be_pickled(self, calc):
+        """Test that a calculator with tables survives pickling."""
+        # Act
+        restored = pickle.loads(pickle.dumps(calc))
+
+        # Assert
+        assert restored.multiply(7, 8) == 56
+        assert restored.lookup_table_footprint() == calc.lookup_table_footprint()
+
+    def test_copy_uses_its_own_limits(self, calc):
+        """Test that a copied calculator validates with its own range."""
+        # Arrange
+        clone = copy.copy(calc)
+        clone.MAX_VALUE = 100
+
+        # Act & Assert
+        assert clone.multiply(7, 8) == 56
+        with pytest.raises(InvalidInputException):
+            clone.multiply(101, 2)
+
+    def test_from_calculator_keeps_instance_limits(self):
+        """Test that instance range limits are copied and checked."""
+        # Arrange
+        calculator = Calculator()
+        calculator.MAX_VALUE = 10
+
+        # Act
+        tabled = TabledCalculator.from_calculator(calculator, 10)
+
+        # Assert
+        assert tabled.multiply(3, 4) == 12
+        with pytest.raises(InvalidInputException):
+            tabled.multiply(11, 2)
+        with pytest.raises(InvalidInputException):
+            TabledCalculator.from_calculator(calculator, 11)
+
+    def test_memory_budget_is_enforced(self):
+        """Test that tables over the memory budget are refused."""
+        # Act & Assert
+        with pytest.raises(ValueError, match="budget"):
+            TabledCalculator(1000, memory_budget=1024)
+
+    def test_default_budget_refuses_large_domains(self):
+        """Test that the default budget keeps tables small enough to win."""
+        # Act & Assert
+        with pytest.raises(ValueError, match="budget"):
+            TabledCalculator(1000)
+
+    def test_domain_outside_range_raises(self):
+        """Test that a domain beyond the valid range is refused."""
+        # Act & Assert
+        with pytest.raises(InvalidInputException):
+            TabledCalculator(1000001, memory_budget=float("inf"))
+
+    def test_unsupported_operation_raises(self):
+        """Test that only multiply and divide can be tabulated."""
+        # Act & Assert
+        with pytest.raises(ValueError, match="add"):
+            TabledCalculator(10, operations=("add",))
+
+    @pytest.mark.parametrize("high", [-1, 2.5, True])
+    def test_invalid_domain_raises(self, high):
+        """Test that the domain bound must be a non-negative int."""
+        # Act & Assert
+        with pytest.raises(ValueError):
+            TabledCalculator(high)
+
+    def test_benchmark_reports_timings_and_footprint(self):
+        """Test that the benchmark times both paths for each operation."""
+        # Act
+        report = benchmark(10, repeat=1, number=100)
+
+        # Assert
+        assert set(report["multiply"]) == {"plain", "table"}
+        assert set(report["divide"]) == {"plain", "table"}
+        assert report["footprint"]["total"] == estimate_nbytes(10)
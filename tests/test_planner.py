@@ -0,0 +1,371 @@
+"""
+Test suite for the adaptive execution planner.
+"""
+
+import json
+import math
+
+import pytest
+from src.calculator.batch import STATUS_DIVIDE_BY_ZERO, STATUS_OK, STATUS_OUT_OF_RANGE
+from src.calculator.calculator import Calculator
+from src.calculator.differential import ENGINES, run_differential
+from src.calculator.planner import (
+    SCALAR_FLOOR,
+    Calibration,
+    ExecutionPlanner,
+    calibrate,
+    detect_dtype,
+    numpy_available,
+)
+
+# Costs chosen so the crossover points are easy to reason about:
+# vectorized wins above 1,000 pairs and parallel above 100,000.
+CALIBRATION = Calibration(
+    scalar_per_element=1e-6,
+    vectorized_overhead=1e-3 * 0.9,
+    vectorized_per_element=1e-7,
+    parallel_overhead=0.06,
+    transfer_per_element=1e-8,
+)
+
+
+@pytest.fixture
+def calc():
+    """Create a calculator instance for tests."""
+    return Calculator()
+
+
+@pytest.fixture
+def planner(tmp_path):
+    """Create a planner with fixed costs and two workers."""
+    with ExecutionPlanner(
+        CALIBRATION, cache_path=str(tmp_path / "planner.json"), max_workers=2
+    ) as planner:
+        yield planner
+
+
+class TestDetectDtype:
+    """Tests for the detect_dtype function."""
+
+    def test_int_columns(self):
+        """Test that integer-only columns are classified as int."""
+        # Act & Assert
+        assert detect_dtype([1, 2], [3]) == "int"
+
+    def test_mixed_numeric_columns(self):
+        """Test that int and float columns are classified as float."""
+        # Act & Assert
+        assert detect_dtype([1, 2.5], [3]) == "float"
+
+    def test_other_types_are_object(self):
+        """Test that strings or Decimals make a column object."""
+        # Act & Assert
+        assert detect_dtype([1, "2"]) == "object"
+
+
+class TestPlan:
+    """Tests for planning decisions."""
+
+    def test_tiny_batches_use_scalar(self, planner):
+        """Test that small batches run on the scalar methods."""
+        # Act
+        plan = planner.plan([1] * 10, [2] * 10)
+
+        # Assert
+        assert plan.backend == "scalar"
+        assert plan.workers == 1
+
+    def test_small_batches_skip_calibration(self, tmp_path):
+        """Test that batches below the floor never load or measure costs."""
+        # Arrange
+        planner = ExecutionPlanner(cache_path=str(tmp_path / "p.json"), max_workers=2)
+
+        # Act
+        plan = planner.plan([1.0] * (SCALAR_FLOOR - 1))
+
+        # Assert
+        assert plan.backend == "scalar"
+        assert planner._calibration is None
+        assert not (tmp_path / "p.json").exists()
+
+    def test_medium_batches_use_vectorized_when_available(self, planner):
+        """Test that medium batches prefer the vectorized path if possible."""
+        # Act
+        plan = planner.plan([1.0] * 5000, [2.0] * 5000)
+
+        # Assert
+        if numpy_available():
+            assert plan.backend == "vectorized"
+        else:
+            assert plan.backend == "scalar"
+            assert any("NumPy" in reason for reason in plan.reasons)
+
+    def test_huge_batches_use_parallel(self, tmp_path):
+        """Test that very large batches go to the process pool."""
+        # Arrange
+        calibration = CALIBRATION._replace(
+            vectorized_overhead=None, vectorized_per_element=None
+        )
+        planner = ExecutionPlanner(
+            calibration, cache_path=str(tmp_path / "p.json"), max_workers=2
+        )
+
+        # Act
+        plan = planner.plan(range(10**6))
+
+        # Assert
+        assert plan.backend == "parallel"
+        assert plan.workers == 2
+
+    def test_object_columns_skip_vectorized(self, planner):
+        """Test that non-numeric columns are never vectorized."""
+        # Act
+        plan = planner.plan(["1"] * 5000)
+
+        # Assert
+        assert plan.backend != "vectorized"
+        assert plan.dtype == "object"
+
+    def test_overridden_methods_skip_vectorized(self, planner):
+        """Test that a calculator overriding an operation is not vectorized."""
+
+        # Arrange
+        class Doubling(Calculator):
+            def add(self, a, b):
+                return 2 * super().add(a, b)
+
+        # Act
+        plan = planner.plan([1.0] * 5000, [2.0] * 5000, Doubling())
+
+        # Assert
+        assert plan.backend != "vectorized"
+        if numpy_available():
+            assert "vectorized skipped: calculator overrides its methods" in (
+                plan.reasons
+            )
+
+    def test_unpicklable_calculator_skips_parallel(self, planner, calc):
+        """Test that a calculator that cannot be pickled stays in-process."""
+        # Arrange
+        calc.callback = lambda: None
+
+        # Act
+        plan = planner.plan(["1"] * 10**6, calculator=calc)
+
+        # Assert
+        assert plan.backend == "scalar"
+        assert "parallel skipped: calculator cannot be pickled" in plan.reasons
+
+    def test_single_worker_never_plans_parallel(self, tmp_path):
+        """Test that the parallel backend needs more than one worker."""
+        # Arrange
+        planner = ExecutionPlanner(
+            CALIBRATION, cache_path=str(tmp_path / "p.json"), max_workers=1
+        )
+
+        # Act
+        plan = planner.plan(range(10**6))
+
+        # Assert
+        assert plan.backend != "parallel"
+        assert "parallel unavailable: only one worker" in plan.reasons
+
+    def test_thresholds_report_crossovers(self, planner):
+        """Test that thresholds give the size where each backend wins."""
+        # Act
+        thresholds = planner.thresholds()
+
+        # Assert
+        assert thresholds["scalar"] == 0
+        assert thresholds["vectorized"] == (1001 if numpy_available() else None)
+        assert 100000 <= thresholds["parallel"] <= 130000
+
+    def test_explain_lists_decision_and_reasons(self, planner):
+        """Test that explain describes the decision and each estimate."""
+        # Act
+        text = planner.explain(range(SCALAR_FLOOR))
+
+        # Assert
+        assert text.startswith(f"backend=scalar size={SCALAR_FLOOR} dtype=int")
+        assert "scalar estimated at" in text
+        assert "parallel beats scalar from" in text
+
+
+class TestCalibration:
+    """Tests for measuring and caching calibration."""
+
+    def test_calibrate_measures_positive_costs(self):
+        """Test that calibration measures the scalar and parallel costs."""
+        # Act
+        calibration = calibrate(workers=1, sample_size=200)
+
+        # Assert
+        assert calibration.scalar_per_element > 0
+        assert calibration.parallel_overhead > 0
+
+    def test_calibration_is_cached_and_reloaded(self, tmp_path):
+        """Test that a first-use calibration is written and read back."""
+        # Arrange
+        cache_path = str(tmp_path / "nested" / "planner.json")
+        first = ExecutionPlanner(cache_path=cache_path, max_workers=1)
+
+        # Act
+        measured = first.calibration
+        second = ExecutionPlanner(cache_path=cache_path, max_workers=1)
+
+        # Assert
+        assert second._load_calibration() == measured
+        assert second.calibration == measured
+        assert sorted(path.name for path in (tmp_path / "nested").iterdir()) == [
+            "planner.json"
+        ]
+
+    def test_cache_for_other_environment_is_ignored(self, tmp_path):
+        """Test that a cache written for another setup is not reused."""
+        # Arrange
+        cache_path = tmp_path / "planner.json"
+        cache_path.write_text(
+            json.dumps(
+                {
+                    "environment": {"python": "0.0", "numpy": False, "workers": 1},
+                    "calibration": CALIBRATION._asdict(),
+                }
+            )
+        )
+        planner = ExecutionPlanner(cache_path=str(cache_path), max_workers=1)
+
+        # Act & Assert
+        assert planner._load_calibration() is None
+
+    def test_cache_path_from_environment(self, monkeypatch, tmp_path):
+        """Test that CALCULATOR_PLANNER_CACHE overrides the cache location."""
+        # Arrange
+        path = str(tmp_path / "custom.json")
+        monkeypatch.setenv("CALCULATOR_PLANNER_CACHE", path)
+
+        # Act
+        planner = ExecutionPlanner(CALIBRATION)
+
+        # Assert
+        assert planner.cache_path == path
+
+
+class TestExecute:
+    """Tests for running batches through the planner."""
+
+    def test_execute_scalar_matches_calculator(self, planner, calc):
+        """Test that the planned scalar path gives the calculator's results."""
+        # Act
+        result = planner.execute(calc, "multiply", [2, 3], [4, 5])
+
+        # Assert
+        assert list(result.values) == [8, 15]
+
+    def test_execute_parallel_encodes_errors(self, planner, calc):
+        """Test that the process pool path keeps results and errors in order."""
+        # Arrange
+        a_values = list(range(100))
+        b_values = [0, 1000001] + [1] * 98
+
+        # Act
+        result = planner.execute(calc, "/", a_values, b_values, backend="parallel")
+
+        # Assert
+        assert len(result) == 100
+        assert list(result.statuses[:3]) == [
+            STATUS_DIVIDE_BY_ZERO,
+            STATUS_OUT_OF_RANGE,
+            STATUS_OK,
+        ]
+        assert "1000001" in result.message(1)
+        assert result[99] == 99.0
+
+    def test_execute_parallel_keeps_instance_limits(self, planner, calc):
+        """Test that workers use the calculator instance, not a fresh one."""
+        # Arrange
+        calc.MAX_VALUE = 10
+        a_values = list(range(20))
+        b_values = [1] * 20
+
+        # Act
+        parallel = planner.execute(calc, "add", a_values, b_values, "parallel")
+        scalar = planner.execute(calc, "add", a_values, b_values, "scalar")
+
+        # Assert
+        assert list(parallel.statuses) == list(scalar.statuses)
+        assert parallel.message(15) == scalar.message(15)
+
+    def test_execute_vectorized_matches_scalar(self, planner, calc):
+        """Test that the NumPy path matches the scalar path."""
+        # Arrange
+        pytest.importorskip("numpy")
+        a_values = [1, 2.5, 1000001, 7, -4]
+        b_values = [2, 0, 1, 0.5, 2]
+
+        # Act
+        vectorized = planner.execute(
+            calc, "divide", a_values, b_values, backend="vectorized"
+        )
+        scalar = planner.execute(calc, "divide", a_values, b_values, backend="scalar")
+
+        # Assert
+        assert list(vectorized.statuses) == list(scalar.statuses)
+        assert list(vectorized.values) == list(scalar.values)
+        assert vectorized.message(2) == scalar.message(2)
+
+    def test_vectorized_zero_products_keep_scalar_sign(self, planner, calc):
+        """Test that int zero products are 0.0 and float ones keep their sign."""
+        # Arrange
+        pytest.importorskip("numpy")
+        a_values = [0, -5, 0.0, -0.0, 0]
+        b_values = [-5, 0, -5, 5, -5.0]
+
+        # Act
+        vectorized = planner.execute(calc, "*", a_values, b_values, "vectorized")
+        scalar = planner.execute(calc, "*", a_values, b_values, "scalar")
+
+        # Assert
+        signs = [math.copysign(1.0, value) for value in vectorized.values]
+        assert signs == [math.copysign(1.0, value) for value in scalar.values]
+        assert signs == [1.0, 1.0, -1.0, -1.0, -1.0]
+
+    def test_vectorized_matches_differential_reference(self, calc):
+        """Test the NumPy engine against the scalar methods on edge operands."""
+        # Arrange
+        pytest.importorskip("numpy")
+
+        # Act
+        runs = run_differential(calc, {"vectorized": ENGINES["vectorized"]})
+
+        # Assert
+        assert [run.mismatches for run in runs] == [[], [], [], []]
+
+    @pytest.mark.parametrize("backend", [None, "scalar", "vectorized", "parallel"])
+    def test_ints_beyond_float64_are_out_of_range(self, planner, calc, backend):
+        """Test that ints too large for float64 are reported, not raised."""
+        # Arrange
+        if backend == "vectorized":
+            pytest.importorskip("numpy")
+        a_values = [10**400] + [1] * (SCALAR_FLOOR * 5)
+        b_values = [1] * len(a_values)
+
+        # Act
+        result = planner.execute(calc, "add", a_values, b_values, backend)
+
+        # Assert
+        assert result.statuses[0] == STATUS_OUT_OF_RANGE
+        assert result.error_count == 1
+        assert result[1] == 2.0
+
+    @pytest.mark.parametrize("backend", [None, "scalar", "vectorized", "parallel"])
+    def test_length_mismatch_raises_value_error(self, planner, calc, backend):
+        """Test that every backend rejects columns of different lengths."""
+        # Act & Assert
+        with pytest.raises(ValueError, match="same length"):
+            planner.execute(calc, "add", [1, 2], [1], backend)
+
+    def test_unknown_backend_raises_value_error(self, planner, calc):
+        """Test that forcing an unknown backend raises ValueError."""
+        # Act & Assert
+        with pytest.raises(ValueError, match="Unknown backend"):
+            planner.execute(calc, "add", [1], [2], backend="gpu")
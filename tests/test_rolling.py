@@ -0,0 +1,180 @@
+"""
+Test suite for rolling-window aggregates.
+"""
+
+import random
+
+import pytest
+from src.calculator.calculator import Calculator, InvalidInputException
+from src.calculator.rolling import RollingMax, RollingMean, RollingMin, RollingSum
+
+
+@pytest.fixture
+def calc():
+    """Create a calculator instance for tests."""
+    return Calculator()
+
+
+def windows(values, size):
+    """Yield the trailing window after each element."""
+    for end in range(1, len(values) + 1):
+        yield values[max(0, end - size) : end]
+
+
+class TestRollingSum:
+    """Tests for the RollingSum class."""
+
+    def test_sum_matches_recomputed_window(self, calc):
+        """Test that the moving sum equals the sum of each trailing window."""
+        # Arrange
+        rng = random.Random(3)
+        values = [rng.randint(-1000000, 1000000) for _ in range(200)]
+        rolling = RollingSum(7, calc)
+
+        # Act
+        results = [rolling.push(value) for value in values]
+
+        # Assert
+        assert results == [sum(window) for window in windows(values, 7)]
+
+    def test_integer_sum_stays_integer(self, calc):
+        """Test that integer streams are summed exactly."""
+        # Arrange
+        rolling = RollingSum(2, calc)
+
+        # Act
+        result = rolling.extend([1, 2, 3])
+
+        # Assert
+        assert result == 5
+        assert isinstance(result, int)
+
+    def test_float_sum_does_not_drift(self, calc):
+        """Test that long float streams stay close to the exact sum."""
+        # Arrange
+        rng = random.Random(5)
+        values = [rng.uniform(-1000000, 1000000) for _ in range(20000)]
+        values += [0.1] * 10
+        rolling = RollingSum(10, calc, resync_interval=10**9)
+
+        # Act
+        result = rolling.extend(values)
+
+        # Assert
+        assert result == pytest.approx(1.0, abs=1e-9)
+
+    def test_resync_recomputes_exact_sum(self, calc):
+        """Test that resync replaces the running sum with an exact one."""
+        # Arrange
+        rolling = RollingSum(3, calc)
+        rolling.extend([0.1, 0.2, 0.3])
+
+        # Act
+        rolling.resync()
+
+        # Assert
+        assert rolling.value == pytest.approx(0.6)
+
+    def test_out_of_range_element_raises_and_is_not_added(self, calc):
+        """Test that invalid elements are rejected without changing the window."""
+        # Arrange
+        rolling = RollingSum(3, calc)
+        rolling.push(5)
+
+        # Act & Assert
+        with pytest.raises(InvalidInputException) as exc_info:
+            rolling.push(1000001)
+        assert "1000001" in str(exc_info.value)
+        assert rolling.value == 5
+        assert len(rolling) == 1
+
+    def test_invalid_size_raises_value_error(self, calc):
+        """Test that a window size below one is rejected."""
+        # Act & Assert
+        with pytest.raises(ValueError):
+            RollingSum(0, calc)
+
+    def test_invalid_resync_interval_raises_value_error(self, calc):
+        """Test that a resync interval below one is rejected."""
+        # Act & Assert
+        with pytest.raises(ValueError):
+            RollingSum(3, calc, resync_interval=0)
+
+
+class TestRollingMean:
+    """Tests for the RollingMean class."""
+
+    def test_mean_matches_calculator_division(self, calc):
+        """Test that the moving mean matches sum divided by count."""
+        # Arrange
+        values = [4, 8, 6, 2, 10]
+        rolling = RollingMean(3, calc)
+
+        # Act
+        results = [rolling.push(value) for value in values]
+
+        # Assert
+        assert results == [
+            calc.divide(sum(window), len(window)) for window in windows(values, 3)
+        ]
+
+    def test_empty_mean_raises_value_error(self, calc):
+        """Test that the mean of an empty window raises ValueError."""
+        # Arrange
+        rolling = RollingMean(3, calc)
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            rolling.value
+
+
+class TestRollingExtremes:
+    """Tests for the RollingMin and RollingMax classes."""
+
+    def test_min_and_max_match_recomputed_window(self, calc):
+        """Test that moving extremes equal min/max of each trailing window."""
+        # Arrange
+        rng = random.Random(11)
+        values = [rng.randint(-50, 50) for _ in range(500)]
+        rolling_min = RollingMin(9, calc)
+        rolling_max = RollingMax(9, calc)
+
+        # Act
+        minimums = [rolling_min.push(value) for value in values]
+        maximums = [rolling_max.push(value) for value in values]
+
+        # Assert
+        assert minimums == [min(window) for window in windows(values, 9)]
+        assert maximums == [max(window) for window in windows(values, 9)]
+
+    def test_extreme_rejects_out_of_range_element(self, calc):
+        """Test that invalid elements raise InvalidInputException."""
+        # Arrange
+        rolling = RollingMax(3, calc)
+
+        # Act & Assert
+        with pytest.raises(InvalidInputException):
+            rolling.push(-1000001)
+
+    def test_empty_extreme_raises_value_error(self, calc):
+        """Test that an empty window has no extreme."""
+        # Arrange
+        rolling = RollingMin(3, calc)
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            rolling.value
+
+    def test_is_full_after_size_elements(self, calc):
+        """Test that the window reports full once size elements are pushed."""
+        # Arrange
+        rolling = RollingMin(2, calc)
+
+        # Act
+        rolling.push(1)
+        before = rolling.is_full
+        rolling.push(2)
+
+        # Assert
+        assert before is False
+        assert rolling.is_full is True